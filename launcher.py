@@ -19,8 +19,9 @@ else:
 
 sys.path.insert(0, base_path)
 
-# Now import and run the app
-from mickey.app import main
-
 if __name__ == "__main__":
+    # Import the app only in the main process: with the spawn start method,
+    # child processes re-import this module and should not pay for the app.
+    from mickey.app import main
+
     main()
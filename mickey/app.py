@@ -11,12 +11,6 @@ import sys
 from .config import CONFIG_DIR
 from .logging_config import get_logger
 
-# Set Windows AppUserModelID so Task Manager and taskbar show "STT Keyboard"
-# instead of "Python". Must be called before any Qt imports.
-ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(
-    "STTKeyboard.STTKeyboard.App.1"
-)
-
 logger = get_logger("app")
 
 # Lock file for single instance
@@ -57,6 +51,13 @@ def release_lock():
 
 def main():
     """Main entry point."""
+    # Set Windows AppUserModelID so Task Manager and taskbar show "STT Keyboard"
+    # instead of "Python". Must be called before any Qt imports; done here
+    # rather than at import time so importing this module stays cheap.
+    ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(
+        "STTKeyboard.STTKeyboard.App.1"
+    )
+
     # Ensure single instance
     if not acquire_lock():
         print("STT Keyboard is already running.")
@@ -71,27 +72,41 @@ def main():
         logger.info("Permissions OK, launching app")
 
         # ctranslate2 must be loaded BEFORE PyQt6 to avoid DLL conflicts
-        # that cause segfaults on Windows. Pre-load the model here.
+        # that cause segfaults on Windows. Import it here, but defer reading
+        # the model weights to a background thread so the tray shows up fast.
+        import faster_whisper  # noqa: F401
+
         from .config import config
         from .transcriber import Transcriber
 
-        logger.info("Pre-loading Whisper model (before Qt)...")
-        _preloaded_transcriber = Transcriber(
+        transcriber = Transcriber(
             model_size=config.model_size,
             compute_type=config.compute_type,
             device=config.device,
             language=config.language,
             initial_prompt=config.initial_prompt,
+            beam_size=config.beam_size,
+            condition_on_previous_text=config.condition_on_previous_text,
+            vad_filter=config.vad_filter,
         )
-        _preloaded_transcriber._ensure_model()
-        logger.info("Whisper model loaded successfully")
+
+        # Disable vsync throttling for any GL-backed surface; this must be set
+        # before the QApplication is created. Raster-painted widgets need no
+        # pacing: Qt coalesces repeated update() calls into one paint.
+        from PyQt6.QtGui import QSurfaceFormat
+
+        surface_format = QSurfaceFormat.defaultFormat()
+        surface_format.setSwapInterval(0)
+        QSurfaceFormat.setDefaultFormat(surface_format)
 
         from .tray import MickeyApp
 
-        app = MickeyApp(transcriber=_preloaded_transcriber)
+        app = MickeyApp(transcriber=transcriber)
+        logger.info("Loading Whisper model in background...")
+        app.load_model_async()
         app.run()
     except Exception as e:
-        logger.exception(f"Unhandled exception: {e}")
+        logger.exception("Unhandled exception: %s", e)
         raise
     finally:
         logger.info("STT Keyboard shutting down")
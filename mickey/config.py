@@ -1,18 +1,47 @@
 """Configuration for Mickey."""
 
+import copy
 import os
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from typing import ClassVar
 from pathlib import Path
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 CONFIG_DIR = Path(os.environ.get("APPDATA", str(Path.home()))) / "stt-keyboard"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
 
-@dataclass
+def _dumps(data: dict) -> bytes:
+    """Serialize config data to indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _loads(raw: bytes) -> dict:
+    """Parse JSON bytes (orjson when available, else the stdlib parser)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Parsed configs by file path, with the (mtime_ns, size) they were read at
+_LOAD_CACHE: dict[str, tuple[tuple[int, int], "Config"]] = {}
+
+
+@dataclass(slots=True)
 class Config:
     """Mickey configuration."""
 
+    # Shared instance holding the default values (set below); read-only by
+    # convention, copy it before changing anything
+    DEFAULT: ClassVar["Config"]
+
     model_size: str = "small"
     language: str = "en"
     sample_rate: int = 16000
@@ -28,29 +57,82 @@ class Config:
         "Transcription of voice dictation for emails, messages, code comments, "
         "and notes. Uses proper punctuation, capitalization, and natural sentence structure."
     )
+    # Decoding: beam search width (1 = greedy, fastest) and whether each
+    # window is conditioned on the previous one's text
+    beam_size: int = 1
+    condition_on_previous_text: bool = False
+    # Run voice activity detection before decoding (skippable for short,
+    # already-trimmed push-to-talk clips)
+    vad_filter: bool = True
     # Text input method: "sendinput" (default) or "keystroke"
     text_input_method: str = "sendinput"
+    # Send SendInput text in small chunks (for apps that drop large bursts)
+    chunked_typing: bool = False
+    # With chunked typing, skip the pause after chunks that were fully accepted
+    adaptive_typing_delay: bool = False
+    # Transcribe while recording and only finish the tail on release
+    streaming_transcription: bool = False
     # Max recording duration in seconds (0 = unlimited)
     max_recording_duration: int = 300
 
+    @property
+    def initial_prompt_lower(self) -> str:
+        """The initial prompt lowercased, for case-insensitive matching."""
+        return self.initial_prompt.lower()
+
     def save(self) -> None:
-        """Save config to file."""
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(self.__dict__, f, indent=2)
+        """Save config to file.
+
+        Writes to a temporary file and renames it over the config, so a
+        crash mid-write never leaves a truncated config behind; the data is
+        flushed to disk before the rename. The directory and file are created
+        private to the current user.
+        """
+        os.makedirs(CONFIG_DIR, mode=0o700, exist_ok=True)
+        tmp_file = CONFIG_FILE.with_suffix(".tmp")
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(_dumps(asdict(self)))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, CONFIG_FILE)
 
     @classmethod
     def load(cls) -> "Config":
-        """Load config from file, or return defaults."""
-        if CONFIG_FILE.exists():
-            try:
-                with open(CONFIG_FILE) as f:
-                    data = json.load(f)
-                return cls(**data)
-            except (json.JSONDecodeError, TypeError):
-                pass
-        return cls()
+        """Load config from file, or return defaults.
+
+        The parsed result is cached and reused while the file's mtime and
+        size are unchanged, so repeated loads skip the JSON parser.
+        """
+        try:
+            st = os.stat(CONFIG_FILE)
+        except OSError:
+            return cls()
+
+        path = str(CONFIG_FILE)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _LOAD_CACHE.get(path)
+        if cached is not None and cached[0] == stamp:
+            return copy.copy(cached[1])
+
+        try:
+            # One raw read; json decodes the UTF-8 bytes itself, so no
+            # text-mode wrapper or intermediate str is needed
+            data = _loads(CONFIG_FILE.read_bytes())
+            loaded = cls(**data)
+        except (OSError, ValueError, TypeError):
+            # Unreadable file, invalid JSON/encoding, or unknown fields
+            return cls()
+        _LOAD_CACHE[path] = (stamp, loaded)
+        return copy.copy(loaded)
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Forget all parsed configs so the next load() re-reads the file."""
+        _LOAD_CACHE.clear()
+
 
+Config.DEFAULT = Config()
 
 # Global config instance
 config = Config.load()
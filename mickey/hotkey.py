@@ -3,19 +3,52 @@
 from pynput import keyboard
 from typing import Callable, Optional
 
+# Win32 virtual-key code for Right Alt (also reported for AltGr)
+_VK_RMENU = 0xA5
+
+# Keys that act as the push-to-talk hotkey (one hash lookup per event)
+_HOTKEY_KEYS = frozenset({keyboard.Key.alt_r, keyboard.Key.alt_gr})
+
+
+def _noop() -> None:
+    """Default hotkey callback, so the event handlers never check for None."""
+
 
 class HotkeyListener:
     """Listens for Right Option key for push-to-talk."""
 
+    __slots__ = (
+        "_hotkey_active",
+        "_listener",
+        "_on_press_callback",
+        "_on_release_callback",
+        "_press_dispatch",
+        "_release_dispatch",
+    )
+
     def __init__(self):
-        self._on_press_callback: Optional[Callable[[], None]] = None
-        self._on_release_callback: Optional[Callable[[], None]] = None
+        self._on_press_callback: Callable[[], None] = _noop
+        self._on_release_callback: Callable[[], None] = _noop
         self._listener: Optional[keyboard.Listener] = None
         self._hotkey_active = False
+        # Hotkey -> bound handler, so each event is a single dict lookup
+        self._press_dispatch = dict.fromkeys(_HOTKEY_KEYS, self._begin)
+        self._release_dispatch = dict.fromkeys(_HOTKEY_KEYS, self._end)
 
-    def _is_hotkey(self, key) -> bool:
+    @staticmethod
+    def _is_hotkey(key) -> bool:
         """Check if key is the Right Alt key."""
-        return key in (keyboard.Key.alt_r, keyboard.Key.alt_gr)
+        return key in _HOTKEY_KEYS
+
+    @staticmethod
+    def _win32_event_filter(msg, data) -> bool:
+        """Drop non-hotkey events in the raw Win32 hook.
+
+        Returning False stops pynput from translating the event into a key
+        object (layout and ToUnicodeEx lookups), which would otherwise run
+        for every keystroke system-wide only to be discarded by _on_press.
+        """
+        return data.vkCode == _VK_RMENU
 
     def set_callbacks(
         self, on_press: Callable[[], None], on_release: Callable[[], None]
@@ -29,26 +62,36 @@ class HotkeyListener:
         self._on_press_callback = on_press
         self._on_release_callback = on_release
 
+    def _begin(self) -> None:
+        """Fire the press callback once per hold (ignores key repeat)."""
+        if not self._hotkey_active:
+            self._hotkey_active = True
+            self._on_press_callback()
+
+    def _end(self) -> None:
+        """Fire the release callback if the hotkey was held."""
+        if self._hotkey_active:
+            self._hotkey_active = False
+            self._on_release_callback()
+
     def _on_press(self, key) -> None:
         """Handle key press events."""
-        if self._is_hotkey(key):
-            if not self._hotkey_active:
-                self._hotkey_active = True
-                if self._on_press_callback:
-                    self._on_press_callback()
+        handler = self._press_dispatch.get(key)
+        if handler is not None:
+            handler()
 
     def _on_release(self, key) -> None:
         """Handle key release events."""
-        if self._is_hotkey(key):
-            if self._hotkey_active:
-                self._hotkey_active = False
-                if self._on_release_callback:
-                    self._on_release_callback()
+        handler = self._release_dispatch.get(key)
+        if handler is not None:
+            handler()
 
     def start(self) -> None:
         """Start listening for the hotkey."""
         self._listener = keyboard.Listener(
-            on_press=self._on_press, on_release=self._on_release
+            on_press=self._on_press,
+            on_release=self._on_release,
+            win32_event_filter=self._win32_event_filter,
         )
         self._listener.start()
 
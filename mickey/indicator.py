@@ -6,35 +6,115 @@ PyQt6 frameless QWidget with waveform animation.
 import math
 import time
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor, QPainter, QPainterPath
+import numpy as np
+from PyQt6.QtCore import QRectF, Qt
+from PyQt6.QtGui import QBrush, QColor, QPainter
 from PyQt6.QtWidgets import QApplication, QWidget
 
+# Geometry constants, bound at module level so the per-frame paint and
+# update methods read globals instead of instance/class attributes
+_WIDTH = 120
+_HEIGHT = 44
+_NUM_BARS = 5
+_BAR_WIDTH = 4
+_BAR_SPACING = 6
+_MIN_BAR_HEIGHT = 4
+_MAX_BAR_HEIGHT = 24
+_BAR_HEIGHT_RANGE = _MAX_BAR_HEIGHT - _MIN_BAR_HEIGHT
+_BG_RADIUS = _HEIGHT / 2
+_BAR_RADIUS = _BAR_WIDTH / 2
+_CENTER_Y = _HEIGHT / 2
+
+# Normalized sine lookup table: (sin(x) + 1) / 2 over one period.
+# Phases are tracked as integer indices into it (masked to wrap around).
+_SIN_LUT_SIZE = 1024
+_SIN_MASK = _SIN_LUT_SIZE - 1
+_WAVE_LUT = (
+    np.sin(np.linspace(0.0, 2 * math.pi, _SIN_LUT_SIZE, endpoint=False)) + 1
+) / 2
+
+
+def _phase_steps(radians: float) -> int:
+    """Convert an angle in radians to a sine LUT index step."""
+    return round(radians / (2 * math.pi) * _SIN_LUT_SIZE)
+
+
+def _blend_wave(heights, phase, offsets, idx, wave, base, scale, keep):
+    """Ease bar heights toward ``base + scale * wave`` in place.
+
+    Evaluates the LUT wave for every bar and applies the exponential
+    smoothing ``heights = keep * heights + (1 - keep) * target`` using the
+    caller's scratch buffers, so a frame allocates no temporary arrays.
+
+    Args:
+        heights: Bar heights, updated in place.
+        phase: Current phase as a LUT index.
+        offsets: Per-bar phase offsets as LUT indices.
+        idx: Integer scratch buffer, same shape as ``heights``.
+        wave: Float scratch buffer, same shape as ``heights``.
+        base: Target height where the wave is 0.
+        scale: Target height added where the wave is 1.
+        keep: Fraction of the previous height kept each frame.
+    """
+    np.add(offsets, phase, out=idx)
+    np.bitwise_and(idx, _SIN_MASK, out=idx)
+    np.take(_WAVE_LUT, idx, out=wave)
+    blend = 1.0 - keep
+    wave *= scale * blend
+    wave += base * blend
+    heights *= keep
+    heights += wave
+
 
 class FloatingIndicator(QWidget):
     """Siri-style floating indicator with audio-reactive waveform."""
 
-    WIDTH = 120
-    HEIGHT = 44
+    WIDTH = _WIDTH
+    HEIGHT = _HEIGHT
+
+    NUM_BARS = _NUM_BARS
+    BAR_WIDTH = _BAR_WIDTH
+    BAR_SPACING = _BAR_SPACING
+    MIN_BAR_HEIGHT = _MIN_BAR_HEIGHT
+    MAX_BAR_HEIGHT = _MAX_BAR_HEIGHT
 
-    NUM_BARS = 5
-    BAR_WIDTH = 4
-    BAR_SPACING = 6
-    MIN_BAR_HEIGHT = 4
-    MAX_BAR_HEIGHT = 24
+    MIN_STATE_CHANGE_INTERVAL_NS = 100_000_000  # 100 ms
 
-    MIN_STATE_CHANGE_INTERVAL = 0.1
+    # Waveform phase steps (LUT indices): per update and per bar offset
+    _RECORDING_STEP = _phase_steps(0.4)
+    _RECORDING_BAR_OFFSET = _phase_steps(0.6)
+    _PROCESSING_STEP = _phase_steps(0.15)
+    _PROCESSING_BAR_OFFSET = _phase_steps(0.8)
 
     def __init__(self):
         super().__init__()
         self._is_visible = False
         self._is_recording = False
         self._is_processing = False
-        self._last_state_change = 0.0
+        self._last_state_change = 0  # time.monotonic_ns()
         self._audio_level = 0.0
-        self._bar_heights = [self.MIN_BAR_HEIGHT] * self.NUM_BARS
-        self._phase = 0.0
-        self._processing_phase = 0.0
+        self._bar_heights = np.full(self.NUM_BARS, float(self.MIN_BAR_HEIGHT))
+        bar_indices = np.arange(self.NUM_BARS)
+        self._recording_offsets = bar_indices * self._RECORDING_BAR_OFFSET
+        self._processing_offsets = bar_indices * self._PROCESSING_BAR_OFFSET
+        self._idx_scratch = np.empty(self.NUM_BARS, dtype=bar_indices.dtype)
+        self._wave_scratch = np.empty(self.NUM_BARS)
+        self._phase = 0
+        self._processing_phase = 0
+
+        # Paint resources and static geometry, built once instead of per frame
+        self._brush_bg = QBrush(QColor(30, 30, 30, 220))
+        self._brush_recording = QBrush(QColor(255, 255, 255, 242))
+        self._brush_processing = QBrush(QColor(255, 153, 0, 255))
+        self._bg_rect = QRectF(0.0, 0.0, float(self.WIDTH), float(self.HEIGHT))
+        total_width = (
+            self.NUM_BARS * self.BAR_WIDTH + (self.NUM_BARS - 1) * self.BAR_SPACING
+        )
+        start_x = self.WIDTH / 2 - total_width / 2
+        self._bar_xs = [
+            start_x + i * (self.BAR_WIDTH + self.BAR_SPACING)
+            for i in range(self.NUM_BARS)
+        ]
 
         # Frameless, always-on-top, tool window (no taskbar), transparent
         self.setWindowFlags(
@@ -66,57 +146,31 @@ class FloatingIndicator(QWidget):
         """Draw the dark pill background and waveform bars."""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
 
         # Dark rounded pill background
-        bg_path = QPainterPath()
-        bg_path.addRoundedRect(
-            0.0,
-            0.0,
-            float(self.WIDTH),
-            float(self.HEIGHT),
-            self.HEIGHT / 2,
-            self.HEIGHT / 2,
-        )
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(30, 30, 30, 220))
-        painter.drawPath(bg_path)
+        painter.setBrush(self._brush_bg)
+        painter.drawRoundedRect(self._bg_rect, _BG_RADIUS, _BG_RADIUS)
 
         # Draw waveform bars
-        center_x = self.WIDTH / 2
-        center_y = self.HEIGHT / 2
-        total_width = (
-            self.NUM_BARS * self.BAR_WIDTH + (self.NUM_BARS - 1) * self.BAR_SPACING
-        )
-        start_x = center_x - total_width / 2
-
-        for i in range(self.NUM_BARS):
-            bar_height = self._bar_heights[i]
-            bar_x = start_x + i * (self.BAR_WIDTH + self.BAR_SPACING)
-            bar_y = center_y - bar_height / 2
-
-            bar_path = QPainterPath()
-            bar_path.addRoundedRect(
-                bar_x,
-                bar_y,
-                self.BAR_WIDTH,
-                bar_height,
-                self.BAR_WIDTH / 2,
-                self.BAR_WIDTH / 2,
+        if self._is_processing:
+            painter.setBrush(self._brush_processing)
+        else:
+            painter.setBrush(self._brush_recording)
+
+        for bar_x, bar_height in zip(self._bar_xs, self._bar_heights.tolist()):
+            painter.drawRoundedRect(
+                QRectF(bar_x, _CENTER_Y - bar_height / 2, _BAR_WIDTH, bar_height),
+                _BAR_RADIUS,
+                _BAR_RADIUS,
             )
 
-            if self._is_processing:
-                painter.setBrush(QColor(255, 153, 0, 255))
-            else:
-                painter.setBrush(QColor(255, 255, 255, 242))
-
-            painter.drawPath(bar_path)
-
         painter.end()
 
     def show_recording(self):
         """Show recording state with audio-reactive animation."""
-        now = time.time()
-        if now - self._last_state_change < self.MIN_STATE_CHANGE_INTERVAL:
+        now = time.monotonic_ns()
+        if now - self._last_state_change < self.MIN_STATE_CHANGE_INTERVAL_NS:
             return
         self._last_state_change = now
 
@@ -127,8 +181,8 @@ class FloatingIndicator(QWidget):
 
     def show_processing(self):
         """Show processing state with gentle wave animation."""
-        now = time.time()
-        if now - self._last_state_change < self.MIN_STATE_CHANGE_INTERVAL:
+        now = time.monotonic_ns()
+        if now - self._last_state_change < self.MIN_STATE_CHANGE_INTERVAL_NS:
             return
         self._last_state_change = now
 
@@ -139,7 +193,7 @@ class FloatingIndicator(QWidget):
 
     def hide(self):
         """Hide the indicator."""
-        self._last_state_change = time.time()
+        self._last_state_change = time.monotonic_ns()
         self._is_visible = False
         self._is_recording = False
         self._is_processing = False
@@ -150,18 +204,20 @@ class FloatingIndicator(QWidget):
         if not self._is_recording:
             return
         self._audio_level = level
-        self._phase += 0.4
-
-        for i in range(self.NUM_BARS):
-            bar_phase = self._phase + i * 0.6
-            wave = (math.sin(bar_phase) + 1) / 2
-
-            height_factor = 0.15 + 0.85 * level * (0.4 + 0.6 * wave)
-            target_height = (
-                self.MIN_BAR_HEIGHT
-                + (self.MAX_BAR_HEIGHT - self.MIN_BAR_HEIGHT) * height_factor
-            )
-            self._bar_heights[i] = self._bar_heights[i] * 0.4 + target_height * 0.6
+        self._phase = (self._phase + self._RECORDING_STEP) & _SIN_MASK
+
+        # Target height factor 0.15 + 0.85 * level * (0.4 + 0.6 * wave),
+        # expanded into the kernel's base + scale * wave form
+        _blend_wave(
+            self._bar_heights,
+            self._phase,
+            self._recording_offsets,
+            self._idx_scratch,
+            self._wave_scratch,
+            _MIN_BAR_HEIGHT + _BAR_HEIGHT_RANGE * (0.15 + 0.34 * level),
+            _BAR_HEIGHT_RANGE * 0.51 * level,
+            0.4,
+        )
 
         self.update()
 
@@ -171,16 +227,20 @@ class FloatingIndicator(QWidget):
             return
 
         if self._is_processing:
-            self._processing_phase += 0.15
-
-            for i in range(self.NUM_BARS):
-                bar_phase = self._processing_phase + i * 0.8
-                wave = (math.sin(bar_phase) + 1) / 2
-                target_height = (
-                    self.MIN_BAR_HEIGHT
-                    + (self.MAX_BAR_HEIGHT - self.MIN_BAR_HEIGHT) * 0.3 * wave
-                )
-                self._bar_heights[i] = self._bar_heights[i] * 0.7 + target_height * 0.3
+            self._processing_phase = (
+                self._processing_phase + self._PROCESSING_STEP
+            ) & _SIN_MASK
+
+            _blend_wave(
+                self._bar_heights,
+                self._processing_phase,
+                self._processing_offsets,
+                self._idx_scratch,
+                self._wave_scratch,
+                _MIN_BAR_HEIGHT,
+                _BAR_HEIGHT_RANGE * 0.3,
+                0.7,
+            )
 
             self.update()
 
@@ -2,6 +2,7 @@
 
 import logging
 import os
+import sys
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
@@ -11,9 +12,12 @@ LOG_DIR = (
 )
 LOG_FILE = LOG_DIR / "app.log"
 
+# Frozen (PyInstaller) builds have no console and drop DEBUG records early
+_FROZEN = getattr(sys, "frozen", False)
+
 # Create logger
 logger = logging.getLogger("stt-keyboard")
-logger.setLevel(logging.DEBUG)
+logger.setLevel(logging.INFO if _FROZEN else logging.DEBUG)
 
 # Ensure log directory exists
 LOG_DIR.mkdir(parents=True, exist_ok=True)
@@ -27,7 +31,7 @@ file_handler = RotatingFileHandler(
 )
 file_handler.setLevel(logging.DEBUG)
 
-# Console handler (for development)
+# Console handler (for development only; frozen builds have no console)
 console_handler = logging.StreamHandler()
 console_handler.setLevel(logging.WARNING)  # Only warnings and errors to console
 
@@ -41,7 +45,8 @@ console_handler.setFormatter(formatter)
 
 # Add handlers
 logger.addHandler(file_handler)
-logger.addHandler(console_handler)
+if not _FROZEN:
+    logger.addHandler(console_handler)
 
 
 def get_logger(name: str = None) -> logging.Logger:
@@ -1,15 +1,22 @@
 """Audio recording module."""
 
+import math
 import threading
 import time
 
 import numpy as np
 import sounddevice as sd
 
+from .worker import SerialWorker
+
 
 class AudioRecorder:
     """Records audio from the microphone using callback-based streaming."""
 
+    _LEVEL_SCALE = 15.0  # RMS gain for the 0-1 visualization level
+    _INITIAL_BUFFER_SECONDS = 60  # Buffer grows geometrically past this
+    _SETTLE_DELAY = 0.15  # Seconds to wait after a cleanup that was in flight
+
     def __init__(
         self,
         sample_rate: int = 16000,
@@ -22,49 +29,75 @@ class AudioRecorder:
         self.device = device
         self.max_duration = max_duration  # 0 = unlimited
         self._recording = False
-        self._audio_data: list[np.ndarray] = []
+        # Preallocated sample buffer; the callback writes into it in place
+        initial_seconds = self._INITIAL_BUFFER_SECONDS
+        if max_duration > 0:
+            initial_seconds = min(initial_seconds, max_duration)
+        self._buf = np.empty(initial_seconds * sample_rate * channels, dtype=np.float32)
+        self._pos = 0
         self._current_level: float = 0.0  # Current audio level (0.0 - 1.0)
         self._stream: sd.InputStream | None = None
         self._cleanup_complete = threading.Event()
         self._cleanup_complete.set()  # Initially set (no cleanup pending)
-        self._start_time: float = 0.0
+        # Single persistent daemon worker for stream teardown, reused across
+        # recordings; a hung driver teardown never blocks interpreter exit
+        self._cleanup_pool = SerialWorker("rec-cleanup")
+        self._start_ns: int = 0  # time.monotonic_ns() at start
 
     def start(self) -> None:
         """Start recording audio.
 
         Waits for any pending stream cleanup before starting a new recording
-        to prevent device-busy errors.
+        to prevent device-busy errors; otherwise starts without delay.
         """
-        # Wait for any pending cleanup to complete
-        if not self._cleanup_complete.wait(timeout=0.5):
-            import sys
-
-            print(
-                "Warning: Stream cleanup taking longer than expected",
-                file=sys.stderr,
-            )
-
-        # Additional delay to let audio subsystem fully release resources.
-        time.sleep(0.15)
-
-        self._audio_data = []
+        # Only a stream torn down moments ago needs waiting for; in the common
+        # case cleanup finished long before the next press and we start at once.
+        if not self._cleanup_complete.is_set():
+            if not self._cleanup_complete.wait(timeout=0.5):
+                import sys
+
+                print(
+                    "Warning: Stream cleanup taking longer than expected",
+                    file=sys.stderr,
+                )
+            # Let the audio subsystem fully release the just-closed device.
+            time.sleep(self._SETTLE_DELAY)
+
+        self._pos = 0
         self._recording = True
         self._current_level = 0.0
-        self._start_time = time.time()
+        self._start_ns = time.monotonic_ns()
+
+        # Create and start a new stream for each recording. Prefer the
+        # driver's native period with low latency; some drivers reject that
+        # combination, so fall back to fixed small blocks.
+        try:
+            self._stream = self._open_stream(blocksize=0, latency="low")
+        except sd.PortAudioError:
+            self._stream = self._open_stream(blocksize=512, latency=None)
+        self._stream.start()
 
-        # Create and start a new stream for each recording
-        self._stream = sd.InputStream(
+    def _open_stream(self, blocksize: int, latency: str | None) -> sd.InputStream:
+        """Open an input stream that feeds _audio_callback."""
+        return sd.InputStream(
             samplerate=self.sample_rate,
             channels=self.channels,
             dtype=np.float32,
             device=self.device,
             callback=self._audio_callback,
-            blocksize=512,  # Small blocks for responsive metering
+            blocksize=blocksize,
+            latency=latency,
         )
-        self._stream.start()
 
     def stop(self) -> np.ndarray:
-        """Stop recording and return audio data."""
+        """Stop recording and return audio data.
+
+        The result is a view into the recording buffer, not a copy; it stays
+        valid until the next start(), which reuses the buffer.
+        """
+        # Read the length first; only start() resets the write position, so
+        # a callback still in flight cannot lose samples to a reset here
+        n = self._pos
         self._recording = False
 
         old_stream = self._stream
@@ -83,27 +116,57 @@ class AudioRecorder:
                 finally:
                     self._cleanup_complete.set()
 
-            t = threading.Thread(target=cleanup, daemon=True)
-            t.start()
+            self._cleanup_pool.submit(cleanup)
+
+        # Hand out the collected data without copying it
+        return self._buf[:n]
 
-        # Grab the collected data
-        data = self._audio_data
-        self._audio_data = []
+    def current_buffer_view(self) -> np.ndarray:
+        """Return the audio recorded so far without stopping the stream.
 
-        if not data:
-            return np.array([], dtype=np.float32)
+        The result is a view into the live buffer, valid until the next
+        start(); callers must not modify it.
+        """
+        # Read the length first: a concurrent _grow copies at least that
+        # many samples into the new buffer before swapping it in
+        n = self._pos
+        return self._buf[:n]
 
-        return np.concatenate(data, axis=0).flatten()
+    def close(self) -> None:
+        """Stop any recording and shut down the cleanup worker."""
+        if self._recording:
+            self.stop()
+        self._cleanup_pool.shutdown()
+
+    def _grow(self, needed: int, used: int) -> None:
+        """Grow the sample buffer to hold at least `needed` samples.
+
+        The first `used` samples are carried over into the new buffer.
+        """
+        capacity = max(needed, self._buf.size * 2)
+        new_buf = np.empty(capacity, dtype=np.float32)
+        new_buf[:used] = self._buf[:used]
+        self._buf = new_buf
 
     def _audio_callback(
         self, indata: np.ndarray, frames: int, time_info, status: sd.CallbackFlags
     ) -> None:
         """Callback for audio stream."""
         if self._recording:
-            self._audio_data.append(indata.copy())
-            # Calculate RMS level for visualization (normalized to 0-1)
-            rms = np.sqrt(np.mean(indata**2))
-            self._current_level = min(1.0, rms * 15)
+            # Read the write position once: stop() may run concurrently
+            pos = self._pos
+            flat = indata.reshape(-1)
+            end = pos + flat.size
+            if end > self._buf.size:
+                self._grow(end, pos)
+            self._buf[pos:end] = flat
+            self._pos = end
+
+            # Calculate RMS level for visualization (normalized to 0-1).
+            # np.dot is a single fused pass with no temporary array.
+            rms = math.sqrt(float(np.dot(flat, flat)) / flat.size)
+            level = rms * self._LEVEL_SCALE
+            self._current_level = min(level, 1.0)
 
     @property
     def is_recording(self) -> bool:
@@ -125,4 +188,5 @@ class AudioRecorder:
         """Check if recording has exceeded max duration."""
         if not self._recording or self.max_duration <= 0:
             return False
-        return (time.time() - self._start_time) >= self.max_duration
+        elapsed_ns = time.monotonic_ns() - self._start_ns
+        return elapsed_ns >= self.max_duration * 1_000_000_000
@@ -1,5 +1,6 @@
 """Sound feedback for Mickey."""
 
+import threading
 import time
 import winsound
 from pathlib import Path
@@ -11,38 +12,107 @@ SOUNDS_DIR = Path(__file__).parent / "sounds"
 START_SOUND = SOUNDS_DIR / "mic_unmute.wav"
 STOP_SOUND = SOUNDS_DIR / "mic_mute.wav"
 
+# Whether each bundled sound file exists, checked once at import
+_EXISTS_CACHE: dict[Path, bool] = {}
+
+# Bundled WAV data loaded once at import, so the hotkey path never touches
+# the filesystem; None falls back to playing the file by path
+_START_BYTES: bytes | None = None
+_STOP_BYTES: bytes | None = None
+
+
+def _read_wav(path: Path) -> bytes | None:
+    """Read a bundled WAV file, or return None if it is missing or unreadable."""
+    if not _EXISTS_CACHE[path]:
+        return None
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def invalidate_exists_cache() -> None:
+    """Re-check which bundled sound files exist and reload them (for testing)."""
+    global _START_BYTES, _STOP_BYTES
+
+    _EXISTS_CACHE.clear()
+    _EXISTS_CACHE[START_SOUND] = START_SOUND.is_file()
+    _EXISTS_CACHE[STOP_SOUND] = STOP_SOUND.is_file()
+    _START_BYTES = _read_wav(START_SOUND)
+    _STOP_BYTES = _read_wav(STOP_SOUND)
+
+
+invalidate_exists_cache()
+
+# Thread class for in-memory playback, aliased so tests can run it inline
+_Thread = threading.Thread
+
 # Debounce settings
-_DEBOUNCE_INTERVAL = 0.1  # Minimum seconds between sound plays
-_last_sound_time: float = 0.0
+_DEBOUNCE_INTERVAL_NS = 100_000_000  # Minimum time between sound plays (100 ms)
+_last_sound_time: int = 0  # time.monotonic_ns() of the last play
 
 
 def reset_debounce() -> None:
     """Reset the debounce timer (for testing)."""
     global _last_sound_time
-    _last_sound_time = 0.0
+    _last_sound_time = 0
 
 
-def play_sound(sound_path: Path) -> None:
-    """Play a sound file asynchronously with debouncing.
+def _debounced() -> bool:
+    """Return True if a sound was played too recently, else claim the slot."""
+    global _last_sound_time
+
+    now = time.monotonic_ns()
+    if now - _last_sound_time < _DEBOUNCE_INTERVAL_NS:
+        return True
+    _last_sound_time = now
+    return False
+
+
+def _play_wav_data(data: bytes) -> None:
+    """Play in-memory WAV data without blocking, with debouncing.
 
-    Prevents spawning many sound processes on rapid toggles.
+    winsound cannot combine SND_MEMORY with SND_ASYNC, so the synchronous
+    play runs on a daemon thread instead. SND_NODEFAULT keeps a failed play
+    silent rather than falling back to the system beep.
     """
-    global _last_sound_time
+    if _debounced():
+        return
+    _Thread(
+        target=winsound.PlaySound,
+        args=(data, winsound.SND_MEMORY | winsound.SND_NODEFAULT),
+        daemon=True,
+    ).start()
 
-    now = time.time()
-    if now - _last_sound_time < _DEBOUNCE_INTERVAL:
-        return  # Skip if too soon after last sound
 
-    if sound_path.exists():
-        winsound.PlaySound(str(sound_path), winsound.SND_FILENAME | winsound.SND_ASYNC)
-        _last_sound_time = now
+def play_sound(sound_path: Path) -> None:
+    """Play a sound file asynchronously with debouncing.
+
+    Prevents spawning many sound processes on rapid toggles. Existence of
+    the bundled sounds is cached; other paths are checked on each call.
+    """
+    exists = _EXISTS_CACHE.get(sound_path)
+    if exists is None:
+        exists = sound_path.is_file()
+    if not exists or _debounced():
+        return
+    winsound.PlaySound(
+        str(sound_path),
+        winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT,
+    )
 
 
 def play_start_sound() -> None:
     """Play sound when recording starts."""
-    play_sound(START_SOUND)
+    if _START_BYTES is None:
+        play_sound(START_SOUND)
+    else:
+        _play_wav_data(_START_BYTES)
 
 
 def play_stop_sound() -> None:
     """Play sound when recording stops."""
-    play_sound(STOP_SOUND)
+    if _STOP_BYTES is None:
+        play_sound(STOP_SOUND)
+    else:
+        _play_wav_data(_STOP_BYTES)
@@ -0,0 +1,62 @@
+"""Incremental transcription helpers.
+
+Implements the LocalAgreement-2 policy: audio recorded so far is
+transcribed repeatedly, and a word is committed once two consecutive
+hypotheses agree on it, so only the uncommitted tail has to be
+transcribed after the hotkey is released.
+"""
+
+import string
+
+# (start, end, text) with times in seconds
+Word = tuple[float, float, str]
+
+
+def _normalize(text: str) -> str:
+    """Normalize a word for comparison across hypotheses."""
+    return text.strip().strip(string.punctuation).lower()
+
+
+class LocalAgreement:
+    """Commits the longest common prefix of consecutive hypotheses."""
+
+    def __init__(self):
+        self.committed: list[str] = []
+        self.committed_until = 0.0  # End time of the last committed word
+        self._previous: list[Word] = []
+
+    def insert(self, words: list[Word], offset: float = 0.0) -> list[str]:
+        """Add a hypothesis and commit the words it shares with the last one.
+
+        Args:
+            words: Hypothesis words, with times relative to the start of the
+                transcribed audio
+            offset: Position of that audio within the recording, in seconds
+
+        Returns:
+            The newly committed words
+        """
+        hypothesis = [
+            (start + offset, end + offset, text.strip())
+            for start, end, text in words
+            if text.strip() and end + offset > self.committed_until
+        ]
+
+        n = 0
+        limit = min(len(hypothesis), len(self._previous))
+        while n < limit and _normalize(hypothesis[n][2]) == _normalize(
+            self._previous[n][2]
+        ):
+            n += 1
+
+        new_words = [text for _, _, text in hypothesis[:n]]
+        if n:
+            self.committed.extend(new_words)
+            self.committed_until = hypothesis[n - 1][1]
+        self._previous = hypothesis[n:]
+        return new_words
+
+    @property
+    def text(self) -> str:
+        """The committed transcript so far."""
+        return " ".join(self.committed)
@@ -1,5 +1,11 @@
 """Speech-to-text transcription using faster-whisper."""
 
+import bisect
+import functools
+import os
+import threading
+from collections.abc import Iterator
+
 import numpy as np
 
 from .logging_config import get_logger
@@ -13,26 +19,144 @@ class TranscriptionError(Exception):
     pass
 
 
+# CUDA compute types in order of preference: int8 weights with float16
+# activations run faster than pure float16 on tensor-core GPUs
+_CUDA_COMPUTE_TYPES = ("int8_float16", "float16", "int8")
+
+
+@functools.lru_cache(maxsize=1)
 def _detect_device() -> tuple[str, str]:
     """Detect best available device and compute type.
 
+    The probe result is cached for the life of the process, so only the first
+    Transcriber with device="auto" pays for querying the CUDA driver.
+
     Returns:
-        (device, compute_type) tuple, e.g. ("cuda", "float16") or ("cpu", "int8")
+        (device, compute_type) tuple, e.g. ("cuda", "int8_float16") or
+        ("cpu", "int8")
     """
     try:
         import ctranslate2
 
-        ctranslate2.get_supported_compute_types("cuda")
-        logger.info("CUDA is available, using GPU")
-        return "cuda", "float16"
+        supported = ctranslate2.get_supported_compute_types("cuda")
     except Exception as e:
         logger.info("CUDA not available (%s), using CPU", e)
         return "cpu", "int8"
 
+    for compute_type in _CUDA_COMPUTE_TYPES:
+        if compute_type in supported:
+            logger.info("CUDA is available, using GPU (%s)", compute_type)
+            return "cuda", compute_type
+    logger.info("CUDA reports no usable compute type, using CPU")
+    return "cpu", "int8"
+
+
+def _resolve_model_path(model_size: str) -> str:
+    """Resolve a model name to its local snapshot directory if cached.
+
+    Loading from the local directory skips the Hugging Face Hub round-trip
+    that faster-whisper otherwise makes on every start. Uncached models are
+    returned unchanged so WhisperModel downloads them.
+    """
+    if os.path.isdir(model_size):
+        return model_size
+    try:
+        from faster_whisper.utils import download_model
+
+        return download_model(model_size, local_files_only=True)
+    except (ImportError, OSError, ValueError) as e:
+        # Not cached (LocalEntryNotFoundError is an OSError) or not a known
+        # model name; leave it to the model load to resolve or report
+        logger.debug("No local snapshot for model '%s': %s", model_size, e)
+        return model_size
+
+
+# Recordings shorter than this (samples at 16 kHz) or quieter than this RMS
+# amplitude are treated as accidental taps and not transcribed
+_MIN_SAMPLES = 4000  # 0.25 s
+_SILENCE_LEVEL = 1e-3
+
+
+def _is_negligible(audio: np.ndarray) -> bool:
+    """Check whether audio is too short or too quiet to hold any speech.
+
+    Runs before the model is loaded or VAD sees the audio. The level is an
+    RMS from np.dot, one pass with no temporary array.
+    """
+    if audio.size < _MIN_SAMPLES:
+        return True
+    return float(np.dot(audio, audio)) < _SILENCE_LEVEL**2 * audio.size
+
+
+def _as_model_input(audio: np.ndarray) -> np.ndarray:
+    """Return audio as a C-contiguous float32 array, copying only if needed.
+
+    The transcriber owns this layout contract so the model never has to make
+    its own copy; conforming input passes through unchanged. Integer PCM
+    (e.g. int16) is scaled to [-1, 1) in the same pass that converts it;
+    unsigned PCM (e.g. uint8) is first re-centred on its midpoint.
+    """
+    if np.issubdtype(audio.dtype, np.signedinteger):
+        scale = np.float32(1.0 / (np.iinfo(audio.dtype).max + 1))
+        return np.multiply(audio, scale, dtype=np.float32)
+    if np.issubdtype(audio.dtype, np.unsignedinteger):
+        midpoint = 1 << (np.iinfo(audio.dtype).bits - 1)
+        centred = np.subtract(audio, midpoint, dtype=np.float32)
+        centred *= np.float32(1.0 / midpoint)
+        return centred
+    if audio.dtype != np.float32 or not audio.flags.c_contiguous:
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+    return audio
+
+
+# Clips at least this long (samples at 16 kHz) exceed one Whisper window and
+# are transcribed on their own instead of in a batch
+_BATCH_MAX_SAMPLES = 30 * 16000
+
+
+# faster_whisper.WhisperModel, resolved on first model load
+_whisper_cls = None
+
+
+def _get_whisper_cls():
+    """Return the WhisperModel class, importing faster_whisper on first use."""
+    global _whisper_cls
+    if _whisper_cls is None:
+        from faster_whisper import WhisperModel
+
+        _whisper_cls = WhisperModel
+    return _whisper_cls
+
+
+@functools.lru_cache(maxsize=2)
+def _load_model(model_path: str, device: str, compute_type: str):
+    """Load a WhisperModel, shared process-wide per (path, device, compute type).
+
+    Failed loads are not cached. Two entries cover switching to another model
+    and back without keeping several large models alive.
+    """
+    return _get_whisper_cls()(model_path, device=device, compute_type=compute_type)
+
 
 class Transcriber:
     """Transcribes audio to text using Whisper."""
 
+    __slots__ = (
+        "_batched",
+        "_infer_lock",
+        "_model",
+        "_model_lock",
+        "_warmed",
+        "beam_size",
+        "compute_type",
+        "condition_on_previous_text",
+        "device",
+        "initial_prompt",
+        "language",
+        "model_size",
+        "vad_filter",
+    )
+
     def __init__(
         self,
         model_size: str = "base",
@@ -40,11 +164,41 @@ class Transcriber:
         device: str = "auto",
         language: str = "en",
         initial_prompt: str = "",
+        beam_size: int = 5,
+        condition_on_previous_text: bool = True,
+        vad_filter: bool = True,
+        preload: bool = False,
     ):
+        """Initialize the transcriber.
+
+        Args:
+            model_size: Whisper model name or local model directory
+            compute_type: CTranslate2 compute type (ignored when device="auto")
+            device: "cuda", "cpu", or "auto" to detect the best available
+            language: Spoken language code
+            initial_prompt: Text that primes vocabulary and style
+            beam_size: Beam search width (1 = greedy)
+            condition_on_previous_text: Condition each window on the
+                previous window's text
+            vad_filter: Run Silero VAD to drop non-speech before decoding;
+                push-to-talk clips are already trimmed, so it can be skipped
+            preload: Start loading the model on a background thread right
+                away, so the load overlaps with the user's first recording
+                instead of delaying its transcription (default: False)
+        """
         self.model_size = model_size
         self.language = language
         self.initial_prompt = initial_prompt
+        self.beam_size = beam_size
+        self.condition_on_previous_text = condition_on_previous_text
+        self.vad_filter = vad_filter
         self._model = None
+        self._model_lock = threading.Lock()
+        # Serializes inference so a warmup and a real transcription never
+        # run on the model concurrently
+        self._infer_lock = threading.RLock()
+        self._warmed = False
+        self._batched = None  # BatchedInferencePipeline, created on first use
 
         if device == "auto":
             self.device, self.compute_type = _detect_device()
@@ -52,23 +206,51 @@ class Transcriber:
             self.device = device
             self.compute_type = compute_type
 
+        if preload:
+            threading.Thread(target=self._preload, daemon=True).start()
+
+    @classmethod
+    def fast(cls, **kwargs) -> "Transcriber":
+        """Create a transcriber tuned for latency on short push-to-talk clips.
+
+        Uses greedy decoding, no conditioning on previous text and no VAD
+        pass; any of these can be overridden, and other arguments are passed
+        through to the constructor.
+        """
+        options = {
+            "beam_size": 1,
+            "condition_on_previous_text": False,
+            "vad_filter": False,
+        }
+        options.update(kwargs)
+        return cls(**options)
+
+    def _preload(self) -> None:
+        """Load the model in the background, leaving failures to the next use."""
+        try:
+            self._ensure_model()
+        except TranscriptionError as e:
+            logger.error("Background model preload failed: %s", e)
+
     def _ensure_model(self) -> None:
-        """Lazy load the Whisper model."""
-        if self._model is None:
-            try:
-                from faster_whisper import WhisperModel
+        """Lazy load the Whisper model.
 
+        Thread-safe: concurrent callers block until a single load completes.
+        """
+        if self._model is not None:
+            return
+        with self._model_lock:
+            if self._model is not None:
+                return
+            model_path = _resolve_model_path(self.model_size)
+            try:
                 logger.info(
                     "Loading model '%s' on %s (compute_type=%s)",
                     self.model_size,
                     self.device,
                     self.compute_type,
                 )
-                self._model = WhisperModel(
-                    self.model_size,
-                    device=self.device,
-                    compute_type=self.compute_type,
-                )
+                self._model = _load_model(model_path, self.device, self.compute_type)
                 logger.info("Model loaded successfully on %s", self.device)
             except Exception as e:
                 if self.device == "cuda":
@@ -77,11 +259,12 @@ class Transcriber:
                     )
                     self.device = "cpu"
                     self.compute_type = "int8"
-                    self._model = WhisperModel(
-                        self.model_size,
-                        device="cpu",
-                        compute_type=self.compute_type,
-                    )
+                    try:
+                        self._model = _load_model(model_path, "cpu", self.compute_type)
+                    except Exception as cpu_error:
+                        raise TranscriptionError(
+                            f"Failed to load Whisper model: {cpu_error}"
+                        ) from cpu_error
                     logger.info("Model loaded successfully on CPU (fallback)")
                 else:
                     raise TranscriptionError(
@@ -95,23 +278,212 @@ class Transcriber:
             audio: Audio data as numpy array (float32, 16kHz mono)
 
         Returns:
-            Transcribed text
+            Transcribed text ("" for empty, very short or silent audio)
         """
-        if len(audio) == 0:
-            return ""
+        # A list lets str.join size its result up front
+        return " ".join(list(self.transcribe_stream(audio)))
+
+    def transcribe_stream(self, audio: np.ndarray) -> Iterator[str]:
+        """Transcribe audio, yielding each segment's text as it is decoded.
+
+        faster-whisper decodes segments lazily, so a caller can act on the
+        first segments (e.g. start typing them) while later ones are still
+        being decoded. The model is locked only while a segment is being
+        decoded, never across a yield, so an abandoned stream does not block
+        later inference and the stream may be resumed from any thread.
+
+        Args:
+            audio: Audio data as numpy array (float32, 16kHz mono)
+
+        Yields:
+            Stripped, non-empty segment texts, in order
+        """
+        audio = _as_model_input(audio)
+        if _is_negligible(audio):
+            return
 
         self._ensure_model()
 
-        try:
-            segments, info = self._model.transcribe(
-                audio,
-                language=self.language,
-                beam_size=5,
-                vad_filter=True,
-                initial_prompt=self.initial_prompt or None,
-            )
-
-            text = " ".join(segment.text.strip() for segment in segments)
-            return text.strip()
-        except Exception as e:
-            raise TranscriptionError(f"Transcription failed: {e}") from e
+        with self._infer_lock:
+            try:
+                segments, _ = self._model.transcribe(
+                    audio,
+                    language=self.language,
+                    beam_size=self.beam_size,
+                    vad_filter=self.vad_filter,
+                    initial_prompt=self.initial_prompt or None,
+                    condition_on_previous_text=self.condition_on_previous_text,
+                )
+                segments = iter(segments)
+            except Exception as e:
+                raise TranscriptionError(f"Transcription failed: {e}") from e
+
+        while True:
+            # Decode the next segment under the lock, then yield outside it
+            with self._infer_lock:
+                try:
+                    segment = next(segments, None)
+                except Exception as e:
+                    raise TranscriptionError(f"Transcription failed: {e}") from e
+            if segment is None:
+                break
+            # Segment text carries a leading space, so each part is stripped,
+            # and blank segments are dropped so a joined transcript gets no
+            # stray spaces
+            text = segment.text.strip()
+            if text:
+                yield text
+        self._warmed = True
+
+    def _get_batched_pipeline(self):
+        """Return a BatchedInferencePipeline over the model, or None.
+
+        The pipeline needs faster-whisper 1.1 or newer; older versions get
+        None and callers fall back to one clip at a time.
+        """
+        if self._batched is None:
+            try:
+                from faster_whisper import BatchedInferencePipeline
+            except ImportError:
+                return None
+            self._ensure_model()
+            self._batched = BatchedInferencePipeline(model=self._model)
+        return self._batched
+
+    def transcribe_batch(
+        self, audios: list[np.ndarray], batch_size: int = 8
+    ) -> list[str]:
+        """Transcribe several clips, decoding the short ones together.
+
+        Clips shorter than one Whisper window are concatenated and passed to
+        faster-whisper's batched pipeline with one clip timestamp each, so
+        their encoder and decoder passes run batch_size at a time. Longer
+        clips are transcribed individually.
+
+        Args:
+            audios: Audio clips as numpy arrays (float32, 16kHz mono)
+            batch_size: Maximum number of clips decoded per batch
+
+        Returns:
+            One transcript per clip, in order ("" for negligible clips)
+        """
+        clips = [_as_model_input(audio) for audio in audios]
+        results = [""] * len(clips)
+        batched = []
+        for i, clip in enumerate(clips):
+            if _is_negligible(clip):
+                continue
+            if clip.size < _BATCH_MAX_SAMPLES:
+                batched.append(i)
+            else:
+                results[i] = self.transcribe(clip)
+        if not batched:
+            return results
+
+        pipeline = self._get_batched_pipeline()
+        if pipeline is None:
+            for i in batched:
+                results[i] = self.transcribe(clips[i])
+            return results
+
+        audio = np.concatenate([clips[i] for i in batched])
+        bounds = np.cumsum([0] + [clips[i].size for i in batched]) / 16000
+        offsets = bounds[:-1].tolist()
+        clip_timestamps = [
+            {"start": start, "end": end}
+            for start, end in zip(offsets, bounds[1:].tolist())
+        ]
+        parts = [[] for _ in batched]
+
+        with self._infer_lock:
+            try:
+                segments, _ = pipeline.transcribe(
+                    audio,
+                    language=self.language,
+                    beam_size=self.beam_size,
+                    initial_prompt=self.initial_prompt or None,
+                    condition_on_previous_text=self.condition_on_previous_text,
+                    vad_filter=False,
+                    clip_timestamps=clip_timestamps,
+                    batch_size=batch_size,
+                )
+
+                # Segment times are relative to the concatenated audio; the
+                # small slack absorbs float rounding at clip boundaries
+                for segment in segments:
+                    text = segment.text.strip()
+                    if text:
+                        clip = bisect.bisect_right(offsets, segment.start + 0.01) - 1
+                        parts[clip].append(text)
+                self._warmed = True
+            except Exception as e:
+                raise TranscriptionError(f"Transcription failed: {e}") from e
+
+        for i, clip_parts in zip(batched, parts):
+            results[i] = " ".join(clip_parts)
+        return results
+
+    def transcribe_words(self, audio: np.ndarray) -> list[tuple[float, float, str]]:
+        """Transcribe audio to timestamped words.
+
+        Args:
+            audio: Audio data as numpy array (float32, 16kHz mono)
+
+        Returns:
+            (start, end, text) tuples, times in seconds from the start of audio
+        """
+        audio = _as_model_input(audio)
+        if _is_negligible(audio):
+            return []
+
+        self._ensure_model()
+
+        with self._infer_lock:
+            try:
+                segments, _ = self._model.transcribe(
+                    audio,
+                    language=self.language,
+                    beam_size=self.beam_size,
+                    vad_filter=self.vad_filter,
+                    initial_prompt=self.initial_prompt or None,
+                    condition_on_previous_text=self.condition_on_previous_text,
+                    word_timestamps=True,
+                )
+
+                words = [
+                    (word.start, word.end, word.word)
+                    for segment in segments
+                    for word in segment.words or ()
+                ]
+                self._warmed = True
+                return words
+            except Exception as e:
+                raise TranscriptionError(f"Transcription failed: {e}") from e
+
+    def warmup(self) -> None:
+        """Run one throwaway inference so the first real transcription is fast.
+
+        Loads the model if needed and decodes a second of silence with VAD
+        disabled (VAD would skip the encoder entirely). Does nothing once the
+        model has run an inference.
+        """
+        if self._warmed:
+            return
+        self._ensure_model()
+
+        with self._infer_lock:
+            if self._warmed:
+                return
+            try:
+                segments, _ = self._model.transcribe(
+                    np.zeros(16000, dtype=np.float32),
+                    language=self.language,
+                    beam_size=1,
+                    vad_filter=False,
+                )
+                for _ in segments:
+                    pass
+            except Exception as e:
+                raise TranscriptionError(f"Warmup failed: {e}") from e
+            self._warmed = True
+            logger.debug("Model warmed up")
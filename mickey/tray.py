@@ -3,6 +3,7 @@
 import sounddevice as sd
 import threading
 import time
+from concurrent.futures import Future
 
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject
 from PyQt6.QtGui import QColor, QFont, QIcon, QPainter, QPixmap
@@ -23,27 +24,41 @@ from .typer import TextTyper, InputMethod
 from .hotkey import HotkeyListener
 from .config import config
 from .sounds import play_start_sound, play_stop_sound
+from .worker import SerialWorker
 from .permissions import (
     check_microphone_permission,
     open_microphone_preferences,
     request_microphone_permission,
 )
 from .indicator import get_indicator
+from .streaming import LocalAgreement
 from .logging_config import get_logger
 
 logger = get_logger("tray")
 
+# Display names for text input methods, used in notifications
+_INPUT_METHOD_NAMES = {"sendinput": "SendInput", "keystroke": "Keystroke"}
+
 
 class _TranscriptionSignals(QObject):
-    """Signals for thread-safe communication from transcription thread."""
+    """Signals for thread-safe communication from worker threads.
+
+    Emitted off the main thread, so Qt queues delivery to the main thread.
+    """
 
+    hotkey_pressed = pyqtSignal()
+    hotkey_released = pyqtSignal()
     finished = pyqtSignal(str)  # transcribed text
     error = pyqtSignal(str)  # error message
+    model_loaded = pyqtSignal()
+    model_load_failed = pyqtSignal(str)  # error message
 
 
 class MickeyApp:
     """Mickey system tray application."""
 
+    STREAM_INTERVAL_NS = 2_000_000_000  # Re-transcribe every 2 s while recording
+
     def __init__(self, transcriber=None):
         # Create QApplication if not already running
         self.qt_app = QApplication.instance()
@@ -58,7 +73,9 @@ class MickeyApp:
 
         # System tray icon
         self.tray = QSystemTrayIcon()
-        self.tray.setIcon(self._make_icon("M"))
+        # The three state icons are fixed; render them once
+        self._icons = {letter: self._make_icon(letter) for letter in ("M", "R", "P")}
+        self.tray.setIcon(self._icons["M"])
         self.tray.setToolTip("STT Keyboard - Ready")
 
         # Components
@@ -76,17 +93,32 @@ class MickeyApp:
                 compute_type=config.compute_type,
                 language=config.language,
                 initial_prompt=config.initial_prompt,
+                beam_size=config.beam_size,
+                condition_on_previous_text=config.condition_on_previous_text,
+                vad_filter=config.vad_filter,
             )
         input_method = InputMethod(config.text_input_method)
-        self.typer = TextTyper(method=input_method)
+        self.typer = TextTyper(
+            method=input_method,
+            chunked=config.chunked_typing,
+            adaptive_delay=config.adaptive_typing_delay,
+        )
         self.hotkey = HotkeyListener()
+        # Single persistent inference worker, reused across recordings. Jobs
+        # run in submission order, so a transcription always follows any
+        # warmup or streaming pass queued before it. The worker is a daemon
+        # thread, so quitting mid-decode does not wait for Whisper to finish.
+        self._stt_pool = SerialWorker("mickey-stt")
 
         # State
         self._is_recording = False
         self._is_processing = False
-        self._pending_start = False
-        self._pending_stop = False
-        self._last_stop_time = 0.0
+        self._last_stop_time = 0  # time.monotonic_ns()
+        self._device_cache = None  # (all devices, default input device)
+        self._warmup_started = False
+        self._agreement: LocalAgreement | None = None  # Set while streaming
+        self._stream_future: Future | None = None
+        self._last_stream_ns = 0  # time.monotonic_ns()
 
         # Visual indicator
         self.indicator = get_indicator()
@@ -99,15 +131,21 @@ class MickeyApp:
             on_press=self._on_hotkey_press, on_release=self._on_hotkey_release
         )
 
-        # Signals for thread-safe GUI updates from transcription thread
+        # Signals for thread-safe GUI updates from the hotkey and
+        # transcription threads
         self._signals = _TranscriptionSignals()
+        self._signals.hotkey_pressed.connect(self._do_start_recording)
+        self._signals.hotkey_released.connect(self._do_stop_recording)
         self._signals.finished.connect(self._on_transcription_finished)
         self._signals.error.connect(self._on_transcription_error)
+        self._signals.model_loaded.connect(self._on_model_loaded)
+        self._signals.model_load_failed.connect(self._on_model_load_failed)
 
-        # Timer for pending actions (runs on main thread)
-        self._main_timer = QTimer()
-        self._main_timer.timeout.connect(self._check_pending_actions)
-        self._main_timer.start(20)  # 20ms poll interval
+        # Indicator animation timer (runs on main thread); only active while
+        # recording or processing so the app has no idle wakeups
+        self._animation_timer = QTimer()
+        self._animation_timer.setInterval(33)  # ~30 Hz
+        self._animation_timer.timeout.connect(self._on_animation_tick)
 
     def _make_icon(self, letter: str) -> QIcon:
         """Create a simple text-based icon for the system tray."""
@@ -146,12 +184,14 @@ class MickeyApp:
 
         menu.addSeparator()
 
-        # Input Device submenu
+        # Input Device submenu (one handler for all entries, keyed by data)
         self.device_menu = menu.addMenu("Input Device")
+        self.device_menu.triggered.connect(self._on_device_action)
         self._populate_device_menu()
 
         # Text Input Method submenu
         self.method_menu = menu.addMenu("Text Input Method")
+        self.method_menu.triggered.connect(self._on_method_action)
         self._populate_method_menu()
 
         # Edit Transcription Prompt
@@ -172,28 +212,34 @@ class MickeyApp:
 
         self.tray.setContextMenu(menu)
 
+    def _get_devices(self):
+        """Return (all devices, default input device), queried once.
+
+        Enumerating PortAudio devices is slow on Windows, and the menu only
+        picks up new devices after a restart anyway.
+        """
+        if self._device_cache is None:
+            self._device_cache = (sd.query_devices(), sd.query_devices(kind="input"))
+        return self._device_cache
+
     def _populate_device_menu(self):
         """Populate the input device submenu."""
         self.device_menu.clear()
-        devices = sd.query_devices()
+        devices, default_device = self._get_devices()
         current_device = config.input_device
-        default_device = sd.query_devices(kind="input")
 
         for i, device in enumerate(devices):
             if device["max_input_channels"] > 0:
                 name = device["name"]
                 action = self.device_menu.addAction(name)
                 action.setCheckable(True)
+                action.setData(name)
 
                 if current_device == name or current_device == i:
                     action.setChecked(True)
                 elif current_device is None and device == default_device:
                     action.setChecked(True)
 
-                action.triggered.connect(
-                    lambda checked, n=name: self._select_input_device(n)
-                )
-
         self.device_menu.addSeparator()
         hint = self.device_menu.addAction("Restart app to detect new devices")
         hint.setEnabled(False)
@@ -206,27 +252,40 @@ class MickeyApp:
         sendinput_action = self.method_menu.addAction("SendInput (Default)")
         sendinput_action.setCheckable(True)
         sendinput_action.setChecked(current_method == "sendinput")
-        sendinput_action.triggered.connect(
-            lambda: self._select_input_method("sendinput", "SendInput")
-        )
+        sendinput_action.setData("sendinput")
 
         keystroke_action = self.method_menu.addAction("Keystroke Simulation")
         keystroke_action.setCheckable(True)
         keystroke_action.setChecked(current_method == "keystroke")
-        keystroke_action.triggered.connect(
-            lambda: self._select_input_method("keystroke", "Keystroke")
-        )
+        keystroke_action.setData("keystroke")
+
+    def _on_device_action(self, action):
+        """Dispatch a device submenu click to _select_input_device."""
+        device_name = action.data()
+        if device_name is not None:
+            self._select_input_device(device_name)
+
+    def _on_method_action(self, action):
+        """Dispatch a method submenu click to _select_input_method."""
+        method = action.data()
+        if method is not None:
+            self._select_input_method(method, _INPUT_METHOD_NAMES[method])
 
     def _select_input_device(self, device_name: str):
         """Handle input device selection."""
-        config.input_device = device_name
-        config.save()
-        self.recorder.device = device_name
-
+        # Always restore the checkmarks: clicking the checked entry unchecks it
         for action in self.device_menu.actions():
             if action.isCheckable():
                 action.setChecked(action.text() == device_name)
 
+        if device_name == self.recorder.device:
+            return
+
+        config.input_device = device_name
+        config.save()
+        self.recorder.device = device_name
+        self.typer.reset_focus()
+
         self.tray.showMessage(
             "STT Keyboard",
             f"Input device set to: {device_name}",
@@ -239,6 +298,7 @@ class MickeyApp:
         config.text_input_method = method
         config.save()
         self.typer.method = InputMethod(method)
+        self.typer.reset_focus()
 
         for action in self.method_menu.actions():
             if action.isCheckable():
@@ -305,39 +365,76 @@ class MickeyApp:
                 2000,
             )
 
+    def load_model_async(self) -> None:
+        """Load the Whisper model in a background thread.
+
+        The tray is usable immediately; a hotkey press before the load
+        finishes blocks the transcription worker on the same load.
+        """
+        self.tray.setToolTip("STT Keyboard - Loading model...")
+        self.status_action.setText("Status: Loading model...")
+
+        def load_worker():
+            try:
+                self.transcriber._ensure_model()
+                self._signals.model_loaded.emit()
+            except TranscriptionError as e:
+                logger.error("Model load failed: %s", e)
+                self._signals.model_load_failed.emit(str(e))
+            except Exception as e:
+                logger.exception("Unexpected error while loading the model")
+                self._signals.model_load_failed.emit(str(e))
+
+        thread = threading.Thread(target=load_worker, daemon=True)
+        thread.start()
+
+    def _on_model_loaded(self) -> None:
+        """Handle background model load completion (runs on main thread)."""
+        logger.info("Whisper model loaded successfully")
+        if not self._is_recording and not self._is_processing:
+            self.tray.setToolTip("STT Keyboard - Ready")
+            self.status_action.setText("Status: Ready")
+
+    def _on_model_load_failed(self, error_msg: str) -> None:
+        """Handle background model load failure (runs on main thread)."""
+        if not self._is_recording and not self._is_processing:
+            self.tray.setToolTip("STT Keyboard - Ready")
+            self.status_action.setText("Status: Ready")
+        self.tray.showMessage(
+            "STT Keyboard",
+            error_msg,
+            QSystemTrayIcon.MessageIcon.Critical,
+            3000,
+        )
+
     def _on_hotkey_press(self) -> None:
         """Handle hotkey press (called from pynput thread)."""
         if self._is_recording or self._is_processing:
             return
-        if time.time() - self._last_stop_time < 0.15:
+        if time.monotonic_ns() - self._last_stop_time < 150_000_000:
             return
-        self._pending_start = True
+        self._signals.hotkey_pressed.emit()
 
     def _on_hotkey_release(self) -> None:
         """Handle hotkey release (called from pynput thread)."""
-        if self._is_recording or self._pending_start:
-            self._pending_stop = True
-
-    def _check_pending_actions(self) -> None:
-        """Check for pending actions (runs on main thread via QTimer)."""
-        if self._pending_start:
-            self._pending_start = False
-            self._do_start_recording()
-
-        if self._pending_stop:
-            self._pending_stop = False
-            self._do_stop_recording()
+        # Queued behind any press; a stop without a recording is a no-op
+        self._signals.hotkey_released.emit()
 
+    def _on_animation_tick(self) -> None:
+        """Drive the indicator while active (runs on main thread via QTimer)."""
         if self._is_recording:
-            self.indicator.update_audio_level(self.recorder.current_level)
+            if self.indicator.isVisible():
+                self.indicator.update_audio_level(self.recorder.current_level)
+            self._maybe_stream_transcribe()
             if self.recorder.exceeded_max_duration:
-                self._pending_stop = True
                 self.tray.showMessage(
                     "STT Keyboard",
                     "Max recording duration reached",
                     QSystemTrayIcon.MessageIcon.Warning,
                     2000,
                 )
+                self._do_stop_recording()
+                return
         self.indicator.update_animation()
 
     def _do_start_recording(self) -> None:
@@ -360,7 +457,7 @@ class MickeyApp:
         logger.info("Starting recording")
         self._is_recording = True
         self._last_stop_time = 0
-        self.tray.setIcon(self._make_icon("R"))
+        self.tray.setIcon(self._icons["R"])
         self.tray.setToolTip("STT Keyboard - Recording...")
         self.status_action.setText("Status: Recording...")
         self.indicator.show_recording()
@@ -369,9 +466,9 @@ class MickeyApp:
         try:
             self.recorder.start()
         except Exception as e:
-            logger.error(f"Failed to start recording: {e}")
+            logger.error("Failed to start recording: %s", e)
             self._is_recording = False
-            self.tray.setIcon(self._make_icon("M"))
+            self.tray.setIcon(self._icons["M"])
             self.tray.setToolTip("STT Keyboard - Ready")
             self.status_action.setText("Status: Ready")
             self.indicator.hide()
@@ -383,6 +480,64 @@ class MickeyApp:
             )
             return
 
+        self._animation_timer.start()
+
+        if config.streaming_transcription:
+            self._agreement = LocalAgreement()
+            self._last_stream_ns = time.monotonic_ns()
+
+        # Recording start means a transcription is coming; warm the model
+        # while the user speaks so it is off the release-to-text path
+        if not self._warmup_started:
+            self._warmup_started = True
+            self._stt_pool.submit(self._warmup_worker)
+
+    def _warmup_worker(self) -> None:
+        """Warm up the transcriber (runs on the inference worker)."""
+        try:
+            self.transcriber.warmup()
+        except TranscriptionError as e:
+            logger.warning("Model warmup failed: %s", e)
+        except Exception:
+            logger.exception("Unexpected error during model warmup")
+
+    def _maybe_stream_transcribe(self) -> None:
+        """Transcribe the uncommitted audio so far in the background.
+
+        Runs at most one pass at a time, every STREAM_INTERVAL_NS; words that
+        two consecutive passes agree on are committed (LocalAgreement-2).
+        """
+        if self._agreement is None:
+            return
+        if self._stream_future is not None and not self._stream_future.done():
+            return
+        now = time.monotonic_ns()
+        if now - self._last_stream_ns < self.STREAM_INTERVAL_NS:
+            return
+        self._last_stream_ns = now
+
+        agreement = self._agreement
+        offset = agreement.committed_until
+        sample_rate = self.recorder.sample_rate
+        audio = self.recorder.current_buffer_view()[int(offset * sample_rate) :]
+        if len(audio) < sample_rate:
+            return
+
+        def stream_worker():
+            try:
+                words = self.transcriber.transcribe_words(audio)
+            except TranscriptionError as e:
+                logger.warning("Streaming transcription failed: %s", e)
+                return
+            except Exception:
+                logger.exception("Unexpected error during streaming transcription")
+                return
+            committed = agreement.insert(words, offset)
+            if committed:
+                logger.debug("Committed %d streamed words", len(committed))
+
+        self._stream_future = self._stt_pool.submit(stream_worker)
+
     def _do_stop_recording(self) -> None:
         """Actually stop recording (must run on main thread)."""
         if not self._is_recording:
@@ -391,37 +546,61 @@ class MickeyApp:
         logger.info("Stopping recording")
         self._is_recording = False
         self._is_processing = True
-        self._last_stop_time = time.time()
-        self.tray.setIcon(self._make_icon("P"))
+        self._last_stop_time = time.monotonic_ns()
+        self.tray.setIcon(self._icons["P"])
         self.tray.setToolTip("STT Keyboard - Processing...")
         self.status_action.setText("Status: Processing...")
         self.indicator.show_processing()
         if config.play_sounds:
             play_stop_sound()
 
+        # A view into the recorder's buffer; no new recording can start (and
+        # overwrite it) until _finish_processing runs after this job
         audio = self.recorder.stop()
-        logger.debug(f"Recorded {len(audio)} audio samples")
+        logger.debug("Recorded %d audio samples", len(audio))
+
+        # A streaming pass still waiting in the queue is superseded by this
+        # job, which covers all uncommitted audio; one already running
+        # finishes first on the same worker
+        agreement, self._agreement = self._agreement, None
+        if self._stream_future is not None:
+            self._stream_future.cancel()
+            self._stream_future = None
+        sample_rate = self.recorder.sample_rate
+
+        # Nothing was captured: finish right here on the GUI thread instead of
+        # round-tripping an empty result through the worker and a signal
+        if len(audio) == 0:
+            self._finish_processing()
+            return
 
         def transcribe_worker():
             try:
-                if len(audio) > 0:
+                if agreement is not None and agreement.committed:
+                    # Only the audio after the last committed word is new
+                    logger.info("Transcribing tail after streamed prefix")
+                    tail = audio[int(agreement.committed_until * sample_rate) :]
+                    tail_text = self.transcriber.transcribe(tail)
+                    text = " ".join(filter(None, (agreement.text, tail_text)))
+                    self._signals.finished.emit(text)
+                else:
                     logger.info("Starting transcription")
                     text = self.transcriber.transcribe(audio)
-                    logger.info(f"Transcription complete: {len(text)} chars")
+                    logger.info("Transcription complete: %d chars", len(text))
                     self._signals.finished.emit(text)
-                else:
-                    self._signals.finished.emit("")
             except TranscriptionError as e:
-                logger.error(f"Transcription error: {e}")
+                logger.error("Transcription error: %s", e)
                 self._signals.error.emit(str(e))
+            except Exception as e:
+                logger.exception("Unexpected error during transcription")
+                self._signals.error.emit(f"Transcription failed: {e}")
 
-        thread = threading.Thread(target=transcribe_worker, daemon=True)
-        thread.start()
+        self._stt_pool.submit(transcribe_worker)
 
     def _on_transcription_finished(self, text: str) -> None:
         """Handle transcription result (runs on main thread via signal)."""
         if text:
-            logger.debug(f"Typing text via {self.typer.method.value}")
+            logger.debug("Typing text via %s", self.typer.method.value)
             success = self.typer.type_text(text)
             if not success:
                 logger.error("Typing failed")
@@ -448,15 +627,18 @@ class MickeyApp:
     def _finish_processing(self) -> None:
         """Reset state after processing completes (runs on main thread)."""
         self._is_processing = False
-        self.tray.setIcon(self._make_icon("M"))
+        self.tray.setIcon(self._icons["M"])
         self.tray.setToolTip("STT Keyboard - Ready")
         self.status_action.setText("Status: Ready")
         self.indicator.hide()
+        self._animation_timer.stop()
 
     def _quit_app(self):
         """Quit the application."""
         self.hotkey.stop()
-        self._main_timer.stop()
+        self._animation_timer.stop()
+        self.recorder.close()
+        self._stt_pool.shutdown(cancel_futures=True)
         self.tray.hide()
         QApplication.quit()
 
@@ -3,7 +3,11 @@
 Windows text insertion via SendInput (default) or keystroke simulation.
 """
 
+import ctypes
+import functools
+import struct
 import time
+from ctypes import wintypes
 from enum import Enum
 
 from pynput.keyboard import Controller, Key
@@ -12,6 +16,153 @@ from .logging_config import get_logger
 
 logger = get_logger("typer")
 
+# Win32 SendInput constants
+INPUT_KEYBOARD = 1
+KEYEVENTF_UNICODE = 0x0004
+KEYEVENTF_KEYUP = 0x0002
+
+
+# Structures — union must include MOUSEINPUT (largest member)
+# so ctypes.sizeof(INPUT) matches the Win32 INPUT struct size.
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.POINTER(ctypes.c_ulong)),
+    ]
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.POINTER(ctypes.c_ulong)),
+    ]
+
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ("uMsg", wintypes.DWORD),
+        ("wParamL", wintypes.WORD),
+        ("wParamH", wintypes.WORD),
+    ]
+
+
+class _INPUT_UNION(ctypes.Union):
+    _fields_ = [
+        ("mi", MOUSEINPUT),
+        ("ki", KEYBDINPUT),
+        ("hi", HARDWAREINPUT),
+    ]
+
+
+class INPUT(ctypes.Structure):
+    _fields_ = [
+        ("type", wintypes.DWORD),
+        ("_input", _INPUT_UNION),
+    ]
+
+
+_INPUT_SIZE = ctypes.sizeof(INPUT)
+
+
+@functools.cache
+def _resolve_send_input():
+    """Load user32.SendInput once, with a typed signature.
+
+    Resolved on first send rather than at import so the module stays
+    importable (and testable) off Windows, and so sends skip per-call
+    ctypes.windll attribute lookups.
+    """
+    send_input = ctypes.WinDLL("user32", use_last_error=True).SendInput
+    send_input.argtypes = [wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int]
+    send_input.restype = wintypes.UINT
+    return send_input
+
+
+def _SendInput(n_inputs: int, inputs: ctypes.Array, size: int) -> int:
+    """Call user32.SendInput, returning the number of events accepted."""
+    return _resolve_send_input()(n_inputs, inputs, size)
+
+
+# Byte offsets of the KEYBDINPUT fields within INPUT, taken from the ctypes
+# layout so they match the real struct on any architecture
+_KI_OFFSET = INPUT._input.offset + _INPUT_UNION.ki.offset
+_WSCAN_OFFSET = _KI_OFFSET + KEYBDINPUT.wScan.offset
+_DWFLAGS_OFFSET = _KI_OFFSET + KEYBDINPUT.dwFlags.offset
+
+
+def _input_template(flags: int) -> bytes:
+    """Pack a keyboard INPUT with the given flags and a zero scan code."""
+    buf = bytearray(_INPUT_SIZE)
+    struct.pack_into("<I", buf, INPUT.type.offset, INPUT_KEYBOARD)
+    struct.pack_into("<I", buf, _DWFLAGS_OFFSET, flags)
+    return bytes(buf)
+
+
+# Down + up event pair; only the two wScan fields differ per code unit
+_PAIR_TEMPLATE = _input_template(KEYEVENTF_UNICODE) + _input_template(
+    KEYEVENTF_UNICODE | KEYEVENTF_KEYUP
+)
+
+# Raw bytes of the down + up INPUT pair for each UTF-16 code unit seen so far.
+# Dictation reuses a small alphabet, so this stays small and turns building
+# the event array into lookups plus one bulk copy.
+_EVENT_PAIRS: dict[int, bytes] = {}
+
+
+def _event_pair(code_unit: int) -> bytes:
+    """Return the KEYEVENTF_UNICODE down/up INPUT pair for a code unit."""
+    pair = _EVENT_PAIRS.get(code_unit)
+    if pair is None:
+        buf = bytearray(_PAIR_TEMPLATE)
+        struct.pack_into("<H", buf, _WSCAN_OFFSET, code_unit)
+        struct.pack_into("<H", buf, _INPUT_SIZE + _WSCAN_OFFSET, code_unit)
+        pair = _EVENT_PAIRS[code_unit] = bytes(buf)
+    return pair
+
+
+def _code_units(text: str) -> bytes | memoryview:
+    """Encode text into the UTF-16 code units SendInput expects, in one pass."""
+    if text.isascii():
+        # Common case: every byte is already its own code unit
+        return text.encode("ascii")
+    # UTF-16-LE yields exactly the WORDs SendInput expects, with characters
+    # above the BMP (emoji, etc.) already split into surrogate pairs
+    return memoryview(text.encode("utf-16-le")).cast("H")
+
+
+def _send_code_units(
+    code_units: bytes | memoryview, buf: ctypes.Array | None = None
+) -> int:
+    """Send code units as KEYEVENTF_UNICODE down/up pairs in one SendInput call.
+
+    The INPUT array is created in one copy from cached per-code-unit event
+    bytes, with no per-field assignment.
+
+    Args:
+        code_units: UTF-16 code units, as returned by _code_units
+        buf: Optional preallocated INPUT array to fill instead of allocating
+            a new one; used only if the events fit
+
+    Returns:
+        The number of events SendInput accepted
+    """
+    n_inputs = 2 * len(code_units)
+    payload = b"".join(map(_event_pair, code_units))
+    if buf is not None and n_inputs <= len(buf):
+        # Copy into the caller's array and send a sized view of it
+        ctypes.memmove(buf, payload, len(payload))
+        inputs = (INPUT * n_inputs).from_buffer(buf)
+    else:
+        inputs = (INPUT * n_inputs).from_buffer_copy(payload)
+    return _SendInput(n_inputs, inputs, _INPUT_SIZE)
+
 
 class InputMethod(Enum):
     """Available text input methods."""
@@ -28,26 +179,49 @@ class TextTyper:
     - keystroke: pynput keystroke simulation
     """
 
-    CHUNK_SIZE = 20  # Maximum characters per event batch
+    CHUNK_SIZE = 64  # Maximum UTF-16 code units per event batch when chunked
 
     def __init__(
         self,
         typing_delay: float = 0.004,
         method: InputMethod = None,
+        chunked: bool = False,
+        adaptive_delay: bool = False,
     ):
         """Initialize the typer.
 
         Args:
             typing_delay: Delay between character chunks (default 4ms for reliability)
             method: The input method to use (default: SENDINPUT)
+            chunked: Send SendInput text in CHUNK_SIZE batches separated by
+                typing_delay instead of a single call (default: False)
+            adaptive_delay: When chunked, only wait typing_delay after a chunk
+                that SendInput did not fully accept (default: False)
         """
-        self._controller = Controller()
+        self._keyboard: Controller | None = None  # Created on first use
         self.typing_delay = typing_delay
+        self.chunked = chunked
+        self.adaptive_delay = adaptive_delay
+        self._focus_settled = False
+        # Reused event array, a down + up pair per UTF-16 code unit. Sized
+        # for one chunk and grown geometrically for longer unchunked text.
+        self._input_buf = (INPUT * (2 * self.CHUNK_SIZE))()
         if method is None:
             self.method = InputMethod.SENDINPUT
         else:
             self.method = method
 
+    @property
+    def _controller(self) -> Controller:
+        """The pynput keyboard controller, created on first use.
+
+        Only the keystroke method and press_enter need it, so the default
+        SendInput path never pays for setting it up.
+        """
+        if self._keyboard is None:
+            self._keyboard = Controller()
+        return self._keyboard
+
     def type_text(self, text: str) -> bool:
         """Type text into the active application.
 
@@ -60,6 +234,12 @@ class TextTyper:
         if not text:
             return True
 
+        # Give the target window a moment to take focus on the first paste
+        # only; afterwards focus has already resolved
+        if not self._focus_settled:
+            time.sleep(0.05)
+            self._focus_settled = True
+
         if self.method == InputMethod.KEYSTROKE:
             return self._type_via_keystroke(text)
         else:
@@ -69,7 +249,8 @@ class TextTyper:
         """Type text using Win32 SendInput with Unicode events.
 
         Each character is sent as a KEYEVENTF_UNICODE event pair (down + up).
-        Text is processed in chunks with configurable delay between chunks.
+        The whole text goes out in one call, or in chunks with configurable
+        delay between them when ``chunked`` is set.
 
         Args:
             text: The text to type
@@ -77,106 +258,42 @@ class TextTyper:
         Returns:
             True (always succeeds)
         """
-        import ctypes
-        from ctypes import wintypes
-
-        # Constants
-        INPUT_KEYBOARD = 1
-        KEYEVENTF_UNICODE = 0x0004
-        KEYEVENTF_KEYUP = 0x0002
-
-        # Structures — union must include MOUSEINPUT (largest member)
-        # so ctypes.sizeof(INPUT) matches the Win32 INPUT struct size.
-        class MOUSEINPUT(ctypes.Structure):
-            _fields_ = [
-                ("dx", wintypes.LONG),
-                ("dy", wintypes.LONG),
-                ("mouseData", wintypes.DWORD),
-                ("dwFlags", wintypes.DWORD),
-                ("time", wintypes.DWORD),
-                ("dwExtraInfo", ctypes.POINTER(ctypes.c_ulong)),
-            ]
-
-        class KEYBDINPUT(ctypes.Structure):
-            _fields_ = [
-                ("wVk", wintypes.WORD),
-                ("wScan", wintypes.WORD),
-                ("dwFlags", wintypes.DWORD),
-                ("time", wintypes.DWORD),
-                ("dwExtraInfo", ctypes.POINTER(ctypes.c_ulong)),
-            ]
-
-        class HARDWAREINPUT(ctypes.Structure):
-            _fields_ = [
-                ("uMsg", wintypes.DWORD),
-                ("wParamL", wintypes.WORD),
-                ("wParamH", wintypes.WORD),
-            ]
-
-        class INPUT(ctypes.Structure):
-            class _INPUT(ctypes.Union):
-                _fields_ = [
-                    ("mi", MOUSEINPUT),
-                    ("ki", KEYBDINPUT),
-                    ("hi", HARDWAREINPUT),
-                ]
-
-            _fields_ = [
-                ("type", wintypes.DWORD),
-                ("_input", _INPUT),
-            ]
-
-        # Small delay to ensure focus is on the right window
-        time.sleep(0.05)
-
-        # Process text in chunks
-        for i in range(0, len(text), self.CHUNK_SIZE):
-            chunk = text[i : i + self.CHUNK_SIZE]
-
-            # Build input events for each character
-            inputs = []
-            for char in chunk:
-                code_point = ord(char)
-
-                # Handle surrogate pairs for characters above BMP (emoji, etc.)
-                if code_point > 0xFFFF:
-                    high = 0xD800 + ((code_point - 0x10000) >> 10)
-                    low = 0xDC00 + ((code_point - 0x10000) & 0x3FF)
-                    surrogates = [high, low]
-                else:
-                    surrogates = [code_point]
-
-                for scan_code in surrogates:
-                    # Key down
-                    inp_down = INPUT()
-                    inp_down.type = INPUT_KEYBOARD
-                    inp_down._input.ki.wVk = 0
-                    inp_down._input.ki.wScan = scan_code
-                    inp_down._input.ki.dwFlags = KEYEVENTF_UNICODE
-                    inp_down._input.ki.time = 0
-                    inp_down._input.ki.dwExtraInfo = None
-                    inputs.append(inp_down)
-
-                    # Key up
-                    inp_up = INPUT()
-                    inp_up.type = INPUT_KEYBOARD
-                    inp_up._input.ki.wVk = 0
-                    inp_up._input.ki.wScan = scan_code
-                    inp_up._input.ki.dwFlags = KEYEVENTF_UNICODE | KEYEVENTF_KEYUP
-                    inp_up._input.ki.time = 0
-                    inp_up._input.ki.dwExtraInfo = None
-                    inputs.append(inp_up)
-
-            # Send all inputs for this chunk
-            n_inputs = len(inputs)
-            input_array = (INPUT * n_inputs)(*inputs)
-            ctypes.windll.user32.SendInput(n_inputs, input_array, ctypes.sizeof(INPUT))
-
-            if self.typing_delay > 0 and i + self.CHUNK_SIZE < len(text):
+        # Encode once; chunks are slices of the code units, not re-encodes
+        code_units = _code_units(text)
+        if not self.chunked:
+            _send_code_units(code_units, self._reserve_inputs(len(code_units)))
+            return True
+
+        # Fallback for apps that drop large bursts: send the text in chunks
+        # with a delay between them
+        total = len(code_units)
+        start = 0
+        while start < total:
+            end = min(start + self.CHUNK_SIZE, total)
+            # Never split a surrogate pair across two SendInput calls
+            if end < total and 0xD800 <= code_units[end - 1] <= 0xDBFF:
+                end -= 1
+            n_units = end - start
+            sent = _send_code_units(code_units[start:end], self._input_buf)
+            start = end
+
+            # With adaptive delay, a fully accepted chunk means the target is
+            # keeping up, so only back off after a partial accept
+            if self.adaptive_delay and sent == 2 * n_units:
+                continue
+            if self.typing_delay > 0 and start < total:
                 time.sleep(self.typing_delay)
 
         return True
 
+    def _reserve_inputs(self, n_units: int) -> ctypes.Array:
+        """Return the reusable INPUT array, grown to fit n_units code units."""
+        needed = 2 * n_units
+        if needed > len(self._input_buf):
+            capacity = max(needed, 2 * len(self._input_buf))
+            self._input_buf = (INPUT * capacity)()
+        return self._input_buf
+
     def _type_via_keystroke(self, text: str) -> bool:
         """Type text using pynput keystroke simulation.
 
@@ -188,10 +305,13 @@ class TextTyper:
         Returns:
             True (always succeeds)
         """
-        time.sleep(0.05)
         self._controller.type(text)
         return True
 
+    def reset_focus(self) -> None:
+        """Wait for focus again on the next paste (e.g. after a settings change)."""
+        self._focus_settled = False
+
     def press_enter(self) -> None:
         """Press the Enter key."""
         self._controller.press(Key.enter)
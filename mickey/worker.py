@@ -0,0 +1,76 @@
+"""Single-thread background job runner.
+
+Unlike concurrent.futures.ThreadPoolExecutor, whose workers are joined at
+interpreter exit, the worker here is a daemon thread: a job that hangs (a
+stuck audio driver) or runs long (a Whisper decode) never delays quitting.
+"""
+
+import queue
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+
+
+class SerialWorker:
+    """Runs submitted jobs one at a time, in order, on a daemon thread."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._jobs: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def submit(self, fn: Callable[[], object]) -> Future:
+        """Queue fn to run after any earlier jobs; return its Future.
+
+        Raises:
+            RuntimeError: If the worker has been shut down
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot submit after shutdown")
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=self._name, daemon=True
+                )
+                self._thread.start()
+            self._jobs.put((future, fn))
+        return future
+
+    def shutdown(self, cancel_futures: bool = False) -> None:
+        """Stop accepting jobs and let the thread exit once the queue drains.
+
+        Never waits for a running job. With cancel_futures, jobs that have
+        not started yet are cancelled instead of run.
+        """
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            if cancel_futures:
+                while True:
+                    try:
+                        future, _ = self._jobs.get_nowait()
+                    except queue.Empty:
+                        break
+                    future.cancel()
+            self._jobs.put(None)
+
+    def _run(self) -> None:
+        """Worker loop: run jobs until the shutdown sentinel arrives."""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            future, fn = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn()
+            except BaseException as e:  # noqa: BLE001 - handed to the Future
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+            del job, future, fn
@@ -1,9 +1,20 @@
 """Pytest configuration and fixtures."""
 
+from types import SimpleNamespace
+
+import numpy as np
 import pytest
 from unittest.mock import MagicMock, patch
 
 
+@pytest.fixture(scope="session")
+def default_config():
+    """The shared default Config instance (do not mutate)."""
+    from mickey.config import Config
+
+    return Config.DEFAULT
+
+
 @pytest.fixture
 def temp_config_dir(tmp_path):
     """Create a temporary config directory."""
@@ -18,16 +29,53 @@ def temp_config_file(temp_config_dir):
     return temp_config_dir / "config.json"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_whisper_model():
-    """Mock the WhisperModel for transcriber tests."""
+    """Mock the WhisperModel for transcriber tests (built once per session)."""
     mock_model = MagicMock()
-    mock_segment = MagicMock()
-    mock_segment.text = "Hello world"
-    mock_model.transcribe.return_value = ([mock_segment], MagicMock())
+    mock_segment = SimpleNamespace(text="Hello world")
+    mock_model.transcribe.return_value = ([mock_segment], SimpleNamespace())
     return mock_model
 
 
+@pytest.fixture(autouse=True)
+def reset_mock_whisper_model(request):
+    """Clear recorded calls on the shared model mock after each test that used it."""
+    yield
+    if "mock_whisper_model" in request.fixturenames:
+        request.getfixturevalue("mock_whisper_model").reset_mock()
+
+
+@pytest.fixture
+def mock_whisper(monkeypatch):
+    """Mock WhisperModel class injected where the transcriber resolves it."""
+    mock_cls = MagicMock()
+    monkeypatch.setattr("mickey.transcriber._whisper_cls", mock_cls)
+    yield mock_cls
+
+
+@pytest.fixture(autouse=True)
+def clear_model_cache():
+    """Reset the model/device caches and resolved WhisperModel class around each test."""
+    from mickey.transcriber import _detect_device, _load_model
+
+    _load_model.cache_clear()
+    _detect_device.cache_clear()
+    with patch("mickey.transcriber._whisper_cls", None):
+        yield
+    _load_model.cache_clear()
+    _detect_device.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def dummy_audio():
+    """One second of a quiet 440 Hz tone (16kHz mono), shared and read-only."""
+    t = np.arange(16000, dtype=np.float32) / 16000
+    audio = (0.1 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+    audio.setflags(write=False)
+    return audio
+
+
 @pytest.fixture
 def mock_keyboard_listener():
     """Mock pynput keyboard listener."""
@@ -1,53 +1,80 @@
 """Tests for mickey.config module."""
 
 import json
+import os
+import stat
 from unittest.mock import patch
 
+import pytest
+
+import mickey.config as config_module
 from mickey.config import Config
 
 
 class TestConfigDefaults:
     """Test Config default values."""
 
-    def test_default_model_size(self):
-        config = Config()
+    def test_default_model_size(self, default_config):
+        config = default_config
         assert config.model_size == "small"
 
-    def test_default_language(self):
-        config = Config()
+    def test_default_language(self, default_config):
+        config = default_config
         assert config.language == "en"
 
-    def test_default_sample_rate(self):
-        config = Config()
+    def test_default_sample_rate(self, default_config):
+        config = default_config
         assert config.sample_rate == 16000
 
-    def test_default_channels(self):
-        config = Config()
+    def test_default_channels(self, default_config):
+        config = default_config
         assert config.channels == 1
 
-    def test_default_compute_type(self):
-        config = Config()
+    def test_default_compute_type(self, default_config):
+        config = default_config
         assert config.compute_type == "int8"
 
-    def test_default_play_sounds(self):
-        config = Config()
+    def test_default_play_sounds(self, default_config):
+        config = default_config
         assert config.play_sounds is True
 
-    def test_default_input_device(self):
-        config = Config()
+    def test_default_input_device(self, default_config):
+        config = default_config
         assert config.input_device is None
 
-    def test_default_initial_prompt(self):
-        config = Config()
-        assert "punctuation" in config.initial_prompt.lower()
-        assert "capitalization" in config.initial_prompt.lower()
+    def test_default_initial_prompt(self, default_config):
+        config = default_config
+        prompt = config.initial_prompt_lower
+        assert "punctuation" in prompt
+        assert "capitalization" in prompt
+
+    def test_initial_prompt_lower_follows_prompt(self):
+        config = Config(initial_prompt="First")
+        assert config.initial_prompt_lower == "first"
+        config.initial_prompt = "Second"
+        assert config.initial_prompt_lower == "second"
 
-    def test_default_text_input_method(self):
-        config = Config()
+    def test_default_text_input_method(self, default_config):
+        config = default_config
         assert config.text_input_method == "sendinput"
 
-    def test_default_max_recording_duration(self):
-        config = Config()
+    def test_default_decode_options(self, default_config):
+        config = default_config
+        assert config.beam_size == 1
+        assert config.condition_on_previous_text is False
+        assert config.vad_filter is True
+
+    def test_default_chunked_typing(self, default_config):
+        config = default_config
+        assert config.chunked_typing is False
+        assert config.adaptive_typing_delay is False
+
+    def test_default_streaming_transcription(self, default_config):
+        config = default_config
+        assert config.streaming_transcription is False
+
+    def test_default_max_recording_duration(self, default_config):
+        config = default_config
         assert config.max_recording_duration == 300
 
 
@@ -152,6 +179,45 @@ class TestConfigSaveLoad:
             assert config is not None
 
 
+class TestConfigAtomicSave:
+    def test_save_leaves_no_temp_file(self, tmp_path):
+        config_file = tmp_path / "config.json"
+
+        with (
+            patch("mickey.config.CONFIG_DIR", tmp_path),
+            patch("mickey.config.CONFIG_FILE", config_file),
+        ):
+            Config(model_size="tiny").save()
+
+        assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+
+    def test_save_falls_back_to_stdlib_json(self, tmp_path):
+        config_file = tmp_path / "config.json"
+
+        with (
+            patch("mickey.config.orjson", None),
+            patch("mickey.config.CONFIG_DIR", tmp_path),
+            patch("mickey.config.CONFIG_FILE", config_file),
+        ):
+            Config(model_size="tiny").save()
+
+        assert json.loads(config_file.read_text())["model_size"] == "tiny"
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_save_creates_private_file(self, tmp_path):
+        config_dir = tmp_path / "stt-keyboard"
+        config_file = config_dir / "config.json"
+
+        with (
+            patch("mickey.config.CONFIG_DIR", config_dir),
+            patch("mickey.config.CONFIG_FILE", config_file),
+        ):
+            Config().save()
+
+        assert stat.S_IMODE(config_dir.stat().st_mode) & 0o077 == 0
+        assert stat.S_IMODE(config_file.stat().st_mode) == 0o600
+
+
 class TestConfigRoundTrip:
     """Test Config save/load round-trip."""
 
@@ -188,3 +254,59 @@ class TestConfigRoundTrip:
             assert loaded.input_device == original.input_device
             assert loaded.initial_prompt == original.initial_prompt
             assert loaded.text_input_method == original.text_input_method
+
+
+class TestConfigDefaultInstance:
+    def test_default_matches_fresh_config(self, default_config):
+        assert default_config == Config()
+
+    def test_config_has_no_instance_dict(self):
+        assert not hasattr(Config(), "__dict__")
+
+
+class TestConfigLoadCache:
+    """Test that Config.load() skips re-parsing an unchanged file."""
+
+    def test_load_reuses_parse_when_file_unchanged(self, tmp_path):
+        config_file = tmp_path / "config.json"
+        with open(config_file, "w") as f:
+            json.dump({"model_size": "tiny"}, f)
+
+        with (
+            patch("mickey.config.CONFIG_FILE", config_file),
+            patch("mickey.config._loads", wraps=config_module._loads) as mock_load,
+        ):
+            first = Config.load()
+            second = Config.load()
+
+        assert mock_load.call_count == 1
+        assert first.model_size == second.model_size == "tiny"
+        assert first is not second
+
+    def test_load_reparses_after_file_changes(self, tmp_path):
+        config_file = tmp_path / "config.json"
+        with open(config_file, "w") as f:
+            json.dump({"model_size": "tiny"}, f)
+
+        with patch("mickey.config.CONFIG_FILE", config_file):
+            assert Config.load().model_size == "tiny"
+
+            with open(config_file, "w") as f:
+                json.dump({"model_size": "medium"}, f)
+
+            assert Config.load().model_size == "medium"
+
+    def test_invalidate_cache_forces_reparse(self, tmp_path):
+        config_file = tmp_path / "config.json"
+        with open(config_file, "w") as f:
+            json.dump({"model_size": "tiny"}, f)
+
+        with (
+            patch("mickey.config.CONFIG_FILE", config_file),
+            patch("mickey.config._loads", wraps=config_module._loads) as mock_load,
+        ):
+            Config.load()
+            Config.invalidate_cache()
+            Config.load()
+
+        assert mock_load.call_count == 2
@@ -1,16 +1,17 @@
 """Tests for mickey.hotkey module."""
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 from pynput import keyboard
 
-from mickey.hotkey import HotkeyListener
+from mickey.hotkey import HotkeyListener, _noop
 
 
 class TestHotkeyListenerInit:
     def test_init_sets_defaults(self):
         listener = HotkeyListener()
-        assert listener._on_press_callback is None
-        assert listener._on_release_callback is None
+        assert listener._on_press_callback is _noop
+        assert listener._on_release_callback is _noop
         assert listener._listener is None
         assert listener._hotkey_active is False
 
@@ -47,6 +48,22 @@ class TestIsHotkey:
         assert listener._is_hotkey(keyboard.Key.space) is False
 
 
+class TestWin32EventFilter:
+    def test_filter_passes_right_alt(self):
+        assert (
+            HotkeyListener._win32_event_filter(0x0104, SimpleNamespace(vkCode=0xA5))
+            is True
+        )
+
+    def test_filter_drops_other_keys(self):
+        # VK_LMENU, VK_SHIFT, 'A'
+        for vk in (0xA4, 0x10, 0x41):
+            assert (
+                HotkeyListener._win32_event_filter(0x0100, SimpleNamespace(vkCode=vk))
+                is False
+            )
+
+
 class TestOnPress:
     def test_on_press_triggers_callback_for_hotkey(self):
         listener = HotkeyListener()
@@ -122,6 +139,13 @@ class TestStartStop:
         mock_listener_class.return_value.start.assert_called_once()
         assert listener._listener is not None
 
+    @patch("mickey.hotkey.keyboard.Listener")
+    def test_start_installs_win32_event_filter(self, mock_listener_class):
+        listener = HotkeyListener()
+        listener.start()
+        kwargs = mock_listener_class.call_args[1]
+        assert kwargs["win32_event_filter"] == listener._win32_event_filter
+
     @patch("mickey.hotkey.keyboard.Listener")
     def test_stop_stops_listener(self, mock_listener_class):
         listener = HotkeyListener()
@@ -1,7 +1,6 @@
 """Integration tests for mickey app components."""
 
-import numpy as np
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 
 
 class TestHotkeyTranscriberIntegration:
@@ -61,19 +60,20 @@ class TestSoundsIntegration:
 
 
 class TestRecorderTranscriberIntegration:
-    def test_audio_format_compatibility(self):
+    def test_audio_format_compatibility(self, mock_whisper, dummy_audio):
         from mickey.transcriber import Transcriber
 
-        audio = np.random.randn(16000).astype(np.float32)
+        audio = dummy_audio
 
-        with patch("faster_whisper.WhisperModel") as mock_whisper:
-            mock_model = MagicMock()
-            mock_model.transcribe.return_value = ([MagicMock(text="Test")], MagicMock())
-            mock_whisper.return_value = mock_model
+        mock_model = mock_whisper.return_value
+        mock_model.transcribe.return_value = (
+            [SimpleNamespace(text="Test")],
+            SimpleNamespace(),
+        )
 
-            transcriber = Transcriber()
-            result = transcriber.transcribe(audio)
-            assert isinstance(result, str)
+        transcriber = Transcriber()
+        result = transcriber.transcribe(audio)
+        assert isinstance(result, str)
 
 
 class TestComponentCallbackChain:
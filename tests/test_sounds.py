@@ -1,7 +1,9 @@
 """Tests for mickey.sounds module."""
 
+import os
 import winsound
 from pathlib import Path
+from unittest.mock import patch
 
 from mickey import sounds
 from mickey.sounds import (
@@ -23,15 +25,46 @@ def reset_sound_debounce():
     reset_debounce()
 
 
+class _InlineThread:
+    """Thread stand-in that runs its target synchronously on start()."""
+
+    def __init__(self, target, args=(), daemon=None):
+        self._target = target
+        self._args = args
+
+    def start(self):
+        self._target(*self._args)
+
+
+@pytest.fixture(autouse=True)
+def run_sound_threads_inline():
+    """Run in-memory sound playback synchronously so calls can be asserted."""
+    with patch("mickey.sounds._Thread", _InlineThread):
+        yield
+
+
+@pytest.fixture(scope="module")
+def sound_entries():
+    """Names of the files in the sounds directory, listed once per module."""
+    with os.scandir(SOUNDS_DIR) as entries:
+        return {entry.name for entry in entries if entry.is_file()}
+
+
 class TestSoundPaths:
     def test_sounds_dir_exists(self):
-        assert SOUNDS_DIR.exists(), f"Sounds directory not found: {SOUNDS_DIR}"
+        assert SOUNDS_DIR.is_dir(), f"Sounds directory not found: {SOUNDS_DIR}"
 
-    def test_start_sound_exists(self):
-        assert sounds.START_SOUND.exists(), f"Start sound not found: {sounds.START_SOUND}"
+    def test_start_sound_exists(self, sound_entries):
+        assert sounds.START_SOUND.parent == SOUNDS_DIR
+        assert sounds.START_SOUND.name in sound_entries, (
+            f"Start sound not found: {sounds.START_SOUND}"
+        )
 
-    def test_stop_sound_exists(self):
-        assert sounds.STOP_SOUND.exists(), f"Stop sound not found: {sounds.STOP_SOUND}"
+    def test_stop_sound_exists(self, sound_entries):
+        assert sounds.STOP_SOUND.parent == SOUNDS_DIR
+        assert sounds.STOP_SOUND.name in sound_entries, (
+            f"Stop sound not found: {sounds.STOP_SOUND}"
+        )
 
     def test_sound_files_have_wav_extension(self):
         assert sounds.START_SOUND.suffix == ".wav"
@@ -56,19 +89,51 @@ class TestPlaySound:
         flags = call_args[0][1]
         assert flags & winsound.SND_ASYNC
         assert flags & winsound.SND_FILENAME
+        assert flags & winsound.SND_NODEFAULT
+
+    def test_play_sound_uses_cached_existence(self, mock_sound_backend):
+        with patch.object(Path, "is_file") as mock_is_file:
+            play_sound(sounds.START_SOUND)
+        mock_is_file.assert_not_called()
+        mock_sound_backend.assert_called_once()
+
+    def test_invalidate_exists_cache_rechecks_files(self, mock_sound_backend):
+        with patch.object(Path, "is_file", return_value=False):
+            sounds.invalidate_exists_cache()
+        try:
+            assert sounds._START_BYTES is None
+            assert sounds._STOP_BYTES is None
+            play_sound(sounds.START_SOUND)
+            mock_sound_backend.assert_not_called()
+        finally:
+            sounds.invalidate_exists_cache()
 
 
 class TestPlayStartSound:
     def test_play_start_sound_plays_correct_file(self, mock_sound_backend):
+        play_start_sound()
+        mock_sound_backend.assert_called_once_with(
+            sounds._START_BYTES, winsound.SND_MEMORY | winsound.SND_NODEFAULT
+        )
+        assert sounds._START_BYTES == sounds.START_SOUND.read_bytes()
+
+    def test_play_start_sound_is_debounced(self, mock_sound_backend):
+        play_start_sound()
         play_start_sound()
         mock_sound_backend.assert_called_once()
-        call_args = mock_sound_backend.call_args[0][0]
-        assert "mic_unmute.wav" in str(call_args)
+
+    def test_play_start_sound_falls_back_to_file(self, mock_sound_backend):
+        with patch("mickey.sounds._START_BYTES", None):
+            play_start_sound()
+        sound, flags = mock_sound_backend.call_args[0]
+        assert sound == str(sounds.START_SOUND)
+        assert flags & winsound.SND_FILENAME
 
 
 class TestPlayStopSound:
     def test_play_stop_sound_plays_correct_file(self, mock_sound_backend):
         play_stop_sound()
-        mock_sound_backend.assert_called_once()
-        call_args = mock_sound_backend.call_args[0][0]
-        assert "mic_mute.wav" in str(call_args)
+        mock_sound_backend.assert_called_once_with(
+            sounds._STOP_BYTES, winsound.SND_MEMORY | winsound.SND_NODEFAULT
+        )
+        assert sounds._STOP_BYTES == sounds.STOP_SOUND.read_bytes()
@@ -0,0 +1,48 @@
+"""Tests for mickey.streaming module."""
+
+from mickey.streaming import LocalAgreement
+
+
+class TestLocalAgreement:
+    def test_first_hypothesis_commits_nothing(self):
+        agreement = LocalAgreement()
+        assert agreement.insert([(0.0, 0.5, " Hello"), (0.5, 1.0, " world")]) == []
+        assert agreement.committed == []
+        assert agreement.committed_until == 0.0
+
+    def test_commits_common_prefix(self):
+        agreement = LocalAgreement()
+        agreement.insert([(0.0, 0.5, " Hello"), (0.5, 1.0, " word")])
+        committed = agreement.insert(
+            [(0.0, 0.5, " Hello"), (0.5, 1.0, " world"), (1.0, 1.4, " again")]
+        )
+        assert committed == ["Hello"]
+        assert agreement.committed_until == 0.5
+        assert agreement.text == "Hello"
+
+    def test_comparison_ignores_case_and_punctuation(self):
+        agreement = LocalAgreement()
+        agreement.insert([(0.0, 0.5, " hello"), (0.5, 1.0, " world")])
+        committed = agreement.insert([(0.0, 0.5, " Hello,"), (0.5, 1.0, " world.")])
+        assert committed == ["Hello,", "world."]
+
+    def test_offset_hypotheses_continue_after_commit(self):
+        agreement = LocalAgreement()
+        agreement.insert([(0.0, 0.5, " One"), (0.5, 1.0, " two")])
+        agreement.insert([(0.0, 0.5, " One"), (0.5, 1.0, " two"), (1.0, 1.5, " three")])
+        assert agreement.committed == ["One", "two"]
+
+        # Next pass transcribes only audio after the committed words
+        agreement.insert([(0.0, 0.5, " three"), (0.5, 1.0, " four")], offset=1.0)
+        assert agreement.committed == ["One", "two", "three"]
+        assert agreement.committed_until == 1.5
+
+    def test_drops_words_before_committed_point(self):
+        agreement = LocalAgreement()
+        agreement.insert([(0.0, 0.5, " One")])
+        agreement.insert([(0.0, 0.5, " One"), (0.5, 1.0, " two")])
+        committed = agreement.insert(
+            [(0.0, 0.5, " One"), (0.5, 1.0, " two"), (1.0, 1.5, " three")]
+        )
+        assert committed == ["two"]
+        assert agreement.text == "One two"
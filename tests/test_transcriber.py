@@ -1,9 +1,25 @@
 """Tests for mickey.transcriber module."""
 
+import threading
+from types import SimpleNamespace as NS
+
 import numpy as np
+import pytest
 from unittest.mock import MagicMock, patch
 
-from mickey.transcriber import Transcriber, _detect_device
+from mickey.transcriber import (
+    Transcriber,
+    TranscriptionError,
+    _detect_device,
+    _resolve_model_path,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_model_cache_lookup():
+    """Keep model names unresolved so tests don't depend on the local HF cache."""
+    with patch("mickey.transcriber._resolve_model_path", side_effect=lambda size: size):
+        yield
 
 
 class TestDetectDevice:
@@ -13,12 +29,46 @@ class TestDetectDevice:
             assert device == "cuda"
             assert compute == "float16"
 
+    def test_detect_device_prefers_int8_float16(self):
+        with patch(
+            "ctranslate2.get_supported_compute_types",
+            return_value={"float32", "float16", "int8", "int8_float16"},
+        ):
+            assert _detect_device() == ("cuda", "int8_float16")
+
     def test_detect_device_without_cuda(self):
         with patch("ctranslate2.get_supported_compute_types", side_effect=RuntimeError("no CUDA")):
             device, compute = _detect_device()
             assert device == "cpu"
             assert compute == "int8"
 
+    def test_detect_device_probes_once(self):
+        with patch(
+            "ctranslate2.get_supported_compute_types", return_value={"float16"}
+        ) as mock_probe:
+            assert _detect_device() == _detect_device()
+        mock_probe.assert_called_once()
+
+
+class TestResolveModelPath:
+    def test_returns_cached_snapshot_dir(self, tmp_path):
+        with patch(
+            "faster_whisper.utils.download_model", return_value=str(tmp_path)
+        ) as mock_dl:
+            assert _resolve_model_path("small") == str(tmp_path)
+        mock_dl.assert_called_once_with("small", local_files_only=True)
+
+    def test_returns_name_when_not_cached(self):
+        with patch(
+            "faster_whisper.utils.download_model", side_effect=FileNotFoundError
+        ):
+            assert _resolve_model_path("small") == "small"
+
+    def test_returns_existing_directory_unchanged(self, tmp_path):
+        with patch("faster_whisper.utils.download_model") as mock_dl:
+            assert _resolve_model_path(str(tmp_path)) == str(tmp_path)
+        mock_dl.assert_not_called()
+
 
 class TestTranscriberInit:
     def test_init_with_defaults(self):
@@ -29,6 +79,8 @@ class TestTranscriberInit:
         assert transcriber.compute_type == "int8"
         assert transcriber.language == "en"
         assert transcriber.initial_prompt == ""
+        assert transcriber.beam_size == 5
+        assert transcriber.condition_on_previous_text is True
         assert transcriber._model is None
 
     def test_init_with_explicit_device(self):
@@ -48,35 +100,93 @@ class TestTranscriberInit:
         assert transcriber.device == "cuda"
         assert transcriber.compute_type == "float16"
 
+    def test_fast_uses_greedy_decoding(self):
+        transcriber = Transcriber.fast(device="cpu", language="de")
+        assert transcriber.beam_size == 1
+        assert transcriber.condition_on_previous_text is False
+        assert transcriber.vad_filter is False
+        assert transcriber.language == "de"
+
+    def test_fast_options_can_be_overridden(self):
+        assert Transcriber.fast(device="cpu", vad_filter=True).vad_filter is True
+
     def test_model_is_lazy_loaded(self):
         transcriber = Transcriber(device="cpu")
         assert transcriber._model is None
 
+    def test_preload_loads_model_in_background(self, mock_whisper):
+        loaded = threading.Event()
+        mock_whisper.side_effect = lambda *args, **kwargs: loaded.set() or MagicMock()
+        transcriber = Transcriber(device="cpu", preload=True)
+        assert loaded.wait(timeout=1)
+        transcriber._ensure_model()
+        assert mock_whisper.call_count == 1
+        assert transcriber._model is not None
+
+    def test_preload_failure_is_left_to_next_use(self, mock_whisper):
+        failed = threading.Event()
+
+        def fail(*args, **kwargs):
+            failed.set()
+            raise RuntimeError("bad model")
+
+        mock_whisper.side_effect = fail
+        transcriber = Transcriber(device="cpu", preload=True)
+        assert failed.wait(timeout=1)
+        with pytest.raises(TranscriptionError):
+            transcriber._ensure_model()
+
 
 class TestEnsureModel:
-    def test_ensure_model_loads_model(self):
-        with patch("faster_whisper.WhisperModel") as mock_whisper:
-            transcriber = Transcriber(model_size="small", compute_type="int8", device="cpu")
-            transcriber._ensure_model()
-            mock_whisper.assert_called_once_with("small", device="cpu", compute_type="int8")
-            assert transcriber._model is not None
+    def test_ensure_model_loads_model(self, mock_whisper):
+        transcriber = Transcriber(model_size="small", compute_type="int8", device="cpu")
+        transcriber._ensure_model()
+        mock_whisper.assert_called_once_with("small", device="cpu", compute_type="int8")
+        assert transcriber._model is not None
 
-    def test_ensure_model_only_loads_once(self):
-        with patch("faster_whisper.WhisperModel") as mock_whisper:
-            transcriber = Transcriber(device="cpu")
-            transcriber._ensure_model()
-            transcriber._ensure_model()
-            transcriber._ensure_model()
-            assert mock_whisper.call_count == 1
+    def test_ensure_model_only_loads_once(self, mock_whisper):
+        transcriber = Transcriber(device="cpu")
+        transcriber._ensure_model()
+        transcriber._ensure_model()
+        transcriber._ensure_model()
+        assert mock_whisper.call_count == 1
 
-    def test_ensure_model_cuda_fallback_to_cpu(self):
-        with patch("faster_whisper.WhisperModel") as mock_whisper:
-            mock_whisper.side_effect = [RuntimeError("CUDA error"), MagicMock()]
-            transcriber = Transcriber(device="cuda", compute_type="float16")
+    def test_ensure_model_concurrent_calls_load_once(self, mock_whisper):
+        transcriber = Transcriber(device="cpu")
+        threads = [threading.Thread(target=transcriber._ensure_model) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert mock_whisper.call_count == 1
+
+    def test_transcribers_share_loaded_model(self, mock_whisper):
+        first = Transcriber(model_size="small", device="cpu")
+        second = Transcriber(model_size="small", device="cpu")
+        first._ensure_model()
+        second._ensure_model()
+        assert mock_whisper.call_count == 1
+        assert first._model is second._model
+
+    def test_ensure_model_uses_resolved_whisper_class(self, mock_whisper):
+        transcriber = Transcriber(model_size="small", device="cpu")
+        transcriber._ensure_model()
+        assert transcriber._model is mock_whisper.return_value
+
+    def test_ensure_model_cuda_fallback_to_cpu(self, mock_whisper):
+        mock_whisper.side_effect = [RuntimeError("CUDA error"), MagicMock()]
+        transcriber = Transcriber(device="cuda", compute_type="float16")
+        transcriber._ensure_model()
+        assert transcriber.device == "cpu"
+        assert transcriber.compute_type == "int8"
+        assert mock_whisper.call_count == 2
+
+    def test_ensure_model_cpu_fallback_failure_raises(self, mock_whisper):
+        mock_whisper.side_effect = [RuntimeError("CUDA error"), OSError("no model")]
+        transcriber = Transcriber(device="cuda", compute_type="float16")
+        with pytest.raises(TranscriptionError, match="no model"):
             transcriber._ensure_model()
-            assert transcriber.device == "cpu"
-            assert transcriber.compute_type == "int8"
-            assert mock_whisper.call_count == 2
+        assert transcriber._model is None
 
 
 class TestTranscribe:
@@ -86,119 +196,330 @@ class TestTranscribe:
         assert result == ""
         assert transcriber._model is None
 
-    def test_transcribe_calls_model(self):
-        with patch("faster_whisper.WhisperModel") as mock_whisper_class:
-            mock_model = MagicMock()
-            mock_segment = MagicMock()
-            mock_segment.text = "Hello world"
-            mock_model.transcribe.return_value = ([mock_segment], MagicMock())
-            mock_whisper_class.return_value = mock_model
-
-            transcriber = Transcriber(language="en", device="cpu")
-            audio = np.random.randn(16000).astype(np.float32)
-            transcriber.transcribe(audio)
-
-            mock_model.transcribe.assert_called_once()
-            call_kwargs = mock_model.transcribe.call_args[1]
-            assert call_kwargs["language"] == "en"
-            assert call_kwargs["beam_size"] == 5
-            assert call_kwargs["vad_filter"] is True
-
-    def test_transcribe_returns_text(self):
-        with patch("faster_whisper.WhisperModel") as mock_whisper_class:
-            mock_model = MagicMock()
-            mock_segment = MagicMock()
-            mock_segment.text = "  Hello world  "
-            mock_model.transcribe.return_value = ([mock_segment], MagicMock())
-            mock_whisper_class.return_value = mock_model
+    def test_transcribe_skips_short_audio(
+        self, mock_whisper, mock_whisper_model, dummy_audio
+    ):
+        mock_whisper.return_value = mock_whisper_model
+        transcriber = Transcriber(device="cpu")
+        assert transcriber.transcribe(dummy_audio[:1000]) == ""
+        mock_whisper_model.transcribe.assert_not_called()
 
-            transcriber = Transcriber(device="cpu")
-            audio = np.random.randn(16000).astype(np.float32)
-            result = transcriber.transcribe(audio)
-            assert result == "Hello world"
-
-    def test_transcribe_joins_multiple_segments(self):
-        with patch("faster_whisper.WhisperModel") as mock_whisper_class:
-            mock_model = MagicMock()
-            mock_segments = [
-                MagicMock(text="Hello"),
-                MagicMock(text="world"),
-                MagicMock(text="test"),
-            ]
-            mock_model.transcribe.return_value = (mock_segments, MagicMock())
-            mock_whisper_class.return_value = mock_model
+    def test_transcribe_skips_silent_audio(self, mock_whisper, mock_whisper_model):
+        mock_whisper.return_value = mock_whisper_model
+        transcriber = Transcriber(device="cpu")
+        assert transcriber.transcribe(np.zeros(16000, dtype=np.float32)) == ""
+        mock_whisper_model.transcribe.assert_not_called()
 
-            transcriber = Transcriber(device="cpu")
-            audio = np.random.randn(16000).astype(np.float32)
-            result = transcriber.transcribe(audio)
-            assert result == "Hello world test"
-
-    def test_transcribe_uses_initial_prompt(self):
-        with patch("faster_whisper.WhisperModel") as mock_whisper_class:
-            mock_model = MagicMock()
-            mock_model.transcribe.return_value = ([], MagicMock())
-            mock_whisper_class.return_value = mock_model
-
-            transcriber = Transcriber(initial_prompt="Test prompt", device="cpu")
-            audio = np.random.randn(16000).astype(np.float32)
-            transcriber.transcribe(audio)
-
-            call_kwargs = mock_model.transcribe.call_args[1]
-            assert call_kwargs["initial_prompt"] == "Test prompt"
-
-    def test_transcribe_passes_none_for_empty_prompt(self):
-        with patch("faster_whisper.WhisperModel") as mock_whisper_class:
-            mock_model = MagicMock()
-            mock_model.transcribe.return_value = ([], MagicMock())
-            mock_whisper_class.return_value = mock_model
-
-            transcriber = Transcriber(initial_prompt="", device="cpu")
-            audio = np.random.randn(16000).astype(np.float32)
-            transcriber.transcribe(audio)
-
-            call_kwargs = mock_model.transcribe.call_args[1]
-            assert call_kwargs["initial_prompt"] is None
-
-    def test_transcribe_handles_empty_segments(self):
-        with patch("faster_whisper.WhisperModel") as mock_whisper_class:
-            mock_model = MagicMock()
-            mock_model.transcribe.return_value = ([], MagicMock())
-            mock_whisper_class.return_value = mock_model
+    def test_transcribe_silence_does_not_load_model(self, mock_whisper):
+        transcriber = Transcriber(device="cpu")
+        noise_floor = np.full(16000, 5e-4, dtype=np.float32)
+        assert transcriber.transcribe(noise_floor) == ""
+        assert transcriber._model is None
+        mock_whisper.assert_not_called()
+
+    def test_transcribe_passes_conforming_audio_through(
+        self, mock_whisper, mock_whisper_model, dummy_audio
+    ):
+        mock_whisper.return_value = mock_whisper_model
+        Transcriber(device="cpu").transcribe(dummy_audio)
+        assert mock_whisper_model.transcribe.call_args[0][0] is dummy_audio
+
+    def test_transcribe_does_not_copy_recorder_view(
+        self, mock_whisper, mock_whisper_model, dummy_audio
+    ):
+        buffer = np.zeros(48000, dtype=np.float32)
+        buffer[: dummy_audio.size] = dummy_audio
+        view = buffer[: dummy_audio.size]
+        mock_whisper.return_value = mock_whisper_model
+        Transcriber(device="cpu").transcribe(view)
+        assert np.shares_memory(mock_whisper_model.transcribe.call_args[0][0], buffer)
+
+    def test_transcribe_converts_to_contiguous_float32(
+        self, mock_whisper, mock_whisper_model, dummy_audio
+    ):
+        strided = np.repeat(dummy_audio, 2).astype(np.float64)[::2]
+        mock_whisper.return_value = mock_whisper_model
+        Transcriber(device="cpu").transcribe(strided)
+        audio = mock_whisper_model.transcribe.call_args[0][0]
+        assert audio.dtype == np.float32
+        assert audio.flags.c_contiguous
+
+    def test_transcribe_scales_int16_pcm(
+        self, mock_whisper, mock_whisper_model, dummy_audio
+    ):
+        pcm = (dummy_audio * 32768).astype(np.int16)
+        mock_whisper.return_value = mock_whisper_model
+        Transcriber(device="cpu").transcribe(pcm)
+        audio = mock_whisper_model.transcribe.call_args[0][0]
+        assert audio.dtype == np.float32
+        assert audio.flags.c_contiguous
+        np.testing.assert_allclose(audio, dummy_audio, atol=1 / 32768)
+
+    def test_transcribe_centres_uint8_pcm(
+        self, mock_whisper, mock_whisper_model, dummy_audio
+    ):
+        pcm = np.round(dummy_audio * 128 + 128).astype(np.uint8)
+        mock_whisper.return_value = mock_whisper_model
+        Transcriber(device="cpu").transcribe(pcm)
+        audio = mock_whisper_model.transcribe.call_args[0][0]
+        assert audio.dtype == np.float32
+        assert audio.flags.c_contiguous
+        np.testing.assert_allclose(audio, dummy_audio, atol=1 / 128)
+
+    def test_transcribe_calls_model(
+        self, mock_whisper, mock_whisper_model, dummy_audio
+    ):
+        mock_whisper.return_value = mock_whisper_model
+        transcriber = Transcriber(language="en", device="cpu")
+        assert transcriber.transcribe(dummy_audio) == "Hello world"
+
+        mock_whisper_model.transcribe.assert_called_once()
+        call_kwargs = mock_whisper_model.transcribe.call_args[1]
+        assert call_kwargs["language"] == "en"
+        assert call_kwargs["beam_size"] == 5
+        assert call_kwargs["vad_filter"] is True
+
+    def test_transcribe_returns_text(self, mock_whisper, dummy_audio):
+        mock_model = mock_whisper.return_value
+        mock_model.transcribe.return_value = ([NS(text="  Hello world  ")], NS())
+
+        transcriber = Transcriber(device="cpu")
+        audio = dummy_audio
+        result = transcriber.transcribe(audio)
+        assert result == "Hello world"
+
+    def test_transcribe_joins_multiple_segments(self, mock_whisper, dummy_audio):
+        mock_model = mock_whisper.return_value
+        mock_segments = [
+            NS(text="Hello"),
+            NS(text="world"),
+            NS(text="test"),
+        ]
+        mock_model.transcribe.return_value = (mock_segments, NS())
+
+        transcriber = Transcriber(device="cpu")
+        audio = dummy_audio
+        result = transcriber.transcribe(audio)
+        assert result == "Hello world test"
+
+    def test_transcribe_skips_blank_segments(self, mock_whisper, dummy_audio):
+        mock_whisper.return_value.transcribe.return_value = (
+            [NS(text=" Hello"), NS(text="  "), NS(text=" world ")],
+            NS(),
+        )
+        assert Transcriber(device="cpu").transcribe(dummy_audio) == "Hello world"
+
+    def test_transcribe_stream_yields_segments_lazily(self, mock_whisper, dummy_audio):
+        decoded = []
+
+        def segments():
+            for text in (" Hello", " ", " world"):
+                decoded.append(text)
+                yield NS(text=text)
+
+        mock_whisper.return_value.transcribe.return_value = (segments(), NS())
+        stream = Transcriber(device="cpu").transcribe_stream(dummy_audio)
+        assert next(stream) == "Hello"
+        assert decoded == [" Hello"]
+        assert list(stream) == ["world"]
+
+    def test_abandoned_stream_does_not_block_inference(self, mock_whisper, dummy_audio):
+        mock_model = mock_whisper.return_value
+        mock_model.transcribe.side_effect = lambda *args, **kwargs: (
+            iter([NS(text=" Hello"), NS(text=" world")]),
+            NS(),
+        )
+        transcriber = Transcriber(device="cpu")
+        stream = transcriber.transcribe_stream(dummy_audio)
+        assert next(stream) == "Hello"
 
+        results = []
+        worker = threading.Thread(
+            target=lambda: results.append(transcriber.transcribe(dummy_audio))
+        )
+        worker.start()
+        worker.join(timeout=1)
+        assert results == ["Hello world"]
+
+    def test_transcribe_stream_wraps_decode_errors(self, mock_whisper, dummy_audio):
+        def segments():
+            raise RuntimeError("decode failed")
+            yield
+
+        mock_whisper.return_value.transcribe.return_value = (segments(), NS())
+        with pytest.raises(TranscriptionError):
+            list(Transcriber(device="cpu").transcribe_stream(dummy_audio))
+
+    def test_transcribe_uses_initial_prompt(self, mock_whisper, dummy_audio):
+        mock_model = mock_whisper.return_value
+        mock_model.transcribe.return_value = ([], NS())
+
+        transcriber = Transcriber(initial_prompt="Test prompt", device="cpu")
+        audio = dummy_audio
+        transcriber.transcribe(audio)
+
+        call_kwargs = mock_model.transcribe.call_args[1]
+        assert call_kwargs["initial_prompt"] == "Test prompt"
+
+    def test_transcribe_passes_none_for_empty_prompt(self, mock_whisper, dummy_audio):
+        mock_model = mock_whisper.return_value
+        mock_model.transcribe.return_value = ([], NS())
+
+        transcriber = Transcriber(initial_prompt="", device="cpu")
+        audio = dummy_audio
+        transcriber.transcribe(audio)
+
+        call_kwargs = mock_model.transcribe.call_args[1]
+        assert call_kwargs["initial_prompt"] is None
+
+    def test_transcribe_uses_decode_options(self, mock_whisper, dummy_audio):
+        mock_model = mock_whisper.return_value
+        mock_model.transcribe.return_value = ([], NS())
+
+        transcriber = Transcriber(
+            device="cpu", beam_size=1, condition_on_previous_text=False
+        )
+        audio = dummy_audio
+        transcriber.transcribe(audio)
+
+        call_kwargs = mock_model.transcribe.call_args[1]
+        assert call_kwargs["beam_size"] == 1
+        assert call_kwargs["condition_on_previous_text"] is False
+
+    def test_transcribe_can_skip_vad(
+        self, mock_whisper, mock_whisper_model, dummy_audio
+    ):
+        mock_whisper.return_value = mock_whisper_model
+        Transcriber(device="cpu", vad_filter=False).transcribe(dummy_audio)
+        assert mock_whisper_model.transcribe.call_args[1]["vad_filter"] is False
+
+    def test_transcribe_handles_empty_segments(self, mock_whisper, dummy_audio):
+        mock_model = mock_whisper.return_value
+        mock_model.transcribe.return_value = ([], NS())
+
+        transcriber = Transcriber(device="cpu")
+        audio = dummy_audio
+        result = transcriber.transcribe(audio)
+        assert result == ""
+
+
+class TestTranscribeWords:
+    def test_transcribe_words_empty_audio(self):
+        transcriber = Transcriber(device="cpu")
+        assert transcriber.transcribe_words(np.array([])) == []
+        assert transcriber._model is None
+
+    def test_transcribe_words_returns_timestamped_words(
+        self, mock_whisper, dummy_audio
+    ):
+        mock_model = mock_whisper.return_value
+        words = [
+            NS(start=0.0, end=0.4, word=" Hello"),
+            NS(start=0.4, end=0.9, word=" world"),
+        ]
+        mock_model.transcribe.return_value = ([NS(words=words)], NS())
+
+        transcriber = Transcriber(device="cpu")
+        audio = dummy_audio
+        result = transcriber.transcribe_words(audio)
+
+        assert result == [(0.0, 0.4, " Hello"), (0.4, 0.9, " world")]
+        assert mock_model.transcribe.call_args[1]["word_timestamps"] is True
+
+
+class TestTranscribeBatch:
+    def test_transcribe_batch_returns_list(self, mock_whisper, dummy_audio):
+        with patch("faster_whisper.BatchedInferencePipeline") as mock_pipeline_cls:
+            pipeline = mock_pipeline_cls.return_value
+            pipeline.transcribe.return_value = (
+                [
+                    NS(start=0.0, text=" one"),
+                    NS(start=1.0, text=" two"),
+                    NS(start=1.5, text=" more"),
+                ],
+                NS(),
+            )
             transcriber = Transcriber(device="cpu")
-            audio = np.random.randn(16000).astype(np.float32)
-            result = transcriber.transcribe(audio)
-            assert result == ""
+            silent = np.zeros(16000, dtype=np.float32)
+            result = transcriber.transcribe_batch([dummy_audio, dummy_audio, silent])
+
+        assert result == ["one", "two more", ""]
+        pipeline.transcribe.assert_called_once()
+        mock_pipeline_cls.assert_called_once_with(model=transcriber._model)
+        kwargs = pipeline.transcribe.call_args[1]
+        assert kwargs["clip_timestamps"] == [
+            {"start": 0.0, "end": 1.0},
+            {"start": 1.0, "end": 2.0},
+        ]
+        assert pipeline.transcribe.call_args[0][0].size == 32000
+
+    def test_transcribe_batch_transcribes_long_clips_alone(
+        self, mock_whisper, dummy_audio
+    ):
+        mock_whisper.return_value.transcribe.return_value = ([NS(text=" long")], NS())
+        long_clip = np.tile(dummy_audio, 31)
+        with patch("faster_whisper.BatchedInferencePipeline") as mock_pipeline_cls:
+            result = Transcriber(device="cpu").transcribe_batch([long_clip])
+        assert result == ["long"]
+        mock_pipeline_cls.assert_not_called()
+
+
+class TestWarmup:
+    def test_warmup_runs_silence_without_vad(self, mock_whisper):
+        mock_model = mock_whisper.return_value
+        mock_model.transcribe.return_value = ([], NS())
+
+        transcriber = Transcriber(device="cpu")
+        transcriber.warmup()
+
+        mock_model.transcribe.assert_called_once()
+        audio = mock_model.transcribe.call_args[0][0]
+        assert not audio.any()
+        assert mock_model.transcribe.call_args[1]["vad_filter"] is False
+
+    def test_warmup_runs_once(self, mock_whisper):
+        mock_model = mock_whisper.return_value
+        mock_model.transcribe.return_value = ([], NS())
+
+        transcriber = Transcriber(device="cpu")
+        transcriber.warmup()
+        transcriber.warmup()
+        assert mock_model.transcribe.call_count == 1
+
+    def test_warmup_skipped_after_transcription(self, mock_whisper, dummy_audio):
+        mock_model = mock_whisper.return_value
+        mock_model.transcribe.return_value = ([NS(text="Hi")], NS())
+
+        transcriber = Transcriber(device="cpu")
+        transcriber.transcribe(dummy_audio)
+        transcriber.warmup()
+        assert mock_model.transcribe.call_count == 1
 
 
 class TestTranscriberIntegration:
-    def test_multiple_transcriptions_reuse_model(self):
-        with patch("faster_whisper.WhisperModel") as mock_whisper_class:
-            mock_model = MagicMock()
-            mock_model.transcribe.return_value = ([MagicMock(text="Test")], MagicMock())
-            mock_whisper_class.return_value = mock_model
+    def test_multiple_transcriptions_reuse_model(self, mock_whisper, dummy_audio):
+        mock_model = mock_whisper.return_value
+        mock_model.transcribe.return_value = ([NS(text="Test")], NS())
 
-            transcriber = Transcriber(device="cpu")
-            audio = np.random.randn(16000).astype(np.float32)
-            transcriber.transcribe(audio)
-            transcriber.transcribe(audio)
-            transcriber.transcribe(audio)
-
-            assert mock_whisper_class.call_count == 1
-            assert mock_model.transcribe.call_count == 3
-
-    def test_initial_prompt_can_be_updated(self):
-        with patch("faster_whisper.WhisperModel") as mock_whisper_class:
-            mock_model = MagicMock()
-            mock_model.transcribe.return_value = ([MagicMock(text="Test")], MagicMock())
-            mock_whisper_class.return_value = mock_model
-
-            transcriber = Transcriber(initial_prompt="First prompt", device="cpu")
-            audio = np.random.randn(16000).astype(np.float32)
-            transcriber.transcribe(audio)
-            transcriber.initial_prompt = "Second prompt"
-            transcriber.transcribe(audio)
-
-            calls = mock_model.transcribe.call_args_list
-            assert calls[0][1]["initial_prompt"] == "First prompt"
-            assert calls[1][1]["initial_prompt"] == "Second prompt"
+        transcriber = Transcriber(device="cpu")
+        audio = dummy_audio
+        transcriber.transcribe(audio)
+        transcriber.transcribe(audio)
+        transcriber.transcribe(audio)
+
+        assert mock_whisper.call_count == 1
+        assert mock_model.transcribe.call_count == 3
+
+    def test_initial_prompt_can_be_updated(self, mock_whisper, dummy_audio):
+        mock_model = mock_whisper.return_value
+        mock_model.transcribe.return_value = ([NS(text="Test")], NS())
+
+        transcriber = Transcriber(initial_prompt="First prompt", device="cpu")
+        audio = dummy_audio
+        transcriber.transcribe(audio)
+        transcriber.initial_prompt = "Second prompt"
+        transcriber.transcribe(audio)
+
+        calls = mock_model.transcribe.call_args_list
+        assert calls[0][1]["initial_prompt"] == "First prompt"
+        assert calls[1][1]["initial_prompt"] == "Second prompt"
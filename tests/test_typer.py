@@ -1,8 +1,12 @@
 """Tests for mickey.typer module."""
 
+import ctypes
+import sys
 from unittest.mock import patch, MagicMock
 
-from mickey.typer import TextTyper, InputMethod
+import pytest
+
+from mickey.typer import TextTyper, InputMethod, _event_pair
 
 
 class TestInputMethodEnum:
@@ -23,6 +27,21 @@ class TestInputMethodEnum:
             InputMethod("invalid")
 
 
+class TestInputStructures:
+    def test_input_is_module_level_structure(self):
+        from mickey import typer as typer_module
+
+        assert isinstance(typer_module.INPUT, type)
+        assert issubclass(typer_module.INPUT, ctypes.Structure)
+
+    @pytest.mark.skipif(sys.platform != "win32", reason="Win32 type sizes")
+    def test_input_size_matches_win32(self):
+        from mickey.typer import INPUT
+
+        expected = 40 if ctypes.sizeof(ctypes.c_void_p) == 8 else 28
+        assert ctypes.sizeof(INPUT) == expected
+
+
 class TestTextTyperInit:
     def test_default_method(self):
         typer = TextTyper()
@@ -41,7 +60,19 @@ class TestTextTyperInit:
         assert typer.typing_delay == 0.01
 
     def test_chunk_size_constant(self):
-        assert TextTyper.CHUNK_SIZE == 20
+        assert TextTyper.CHUNK_SIZE == 64
+
+    def test_controller_created_lazily(self):
+        with patch("mickey.typer.Controller") as mock_controller:
+            typer = TextTyper()
+            mock_controller.assert_not_called()
+            assert typer._controller is typer._controller
+        mock_controller.assert_called_once_with()
+
+    def test_not_chunked_by_default(self):
+        typer = TextTyper()
+        assert typer.chunked is False
+        assert typer.adaptive_delay is False
 
 
 class TestTextTyperTypeText:
@@ -53,6 +84,19 @@ class TestTextTyperTypeText:
         typer = TextTyper()
         assert typer.type_text(None) is True
 
+    @patch("mickey.typer.time.sleep")
+    def test_empty_text_returns_before_any_work(self, mock_sleep):
+        typer = TextTyper()
+        with (
+            patch.object(typer, "_type_via_sendinput") as mock_sendinput,
+            patch.object(typer, "_type_via_keystroke") as mock_keystroke,
+        ):
+            assert typer.type_text("") is True
+        mock_sleep.assert_not_called()
+        mock_sendinput.assert_not_called()
+        mock_keystroke.assert_not_called()
+        assert typer._focus_settled is False
+
     def test_sendinput_method_calls_sendinput(self):
         typer = TextTyper(method=InputMethod.SENDINPUT)
         with patch.object(typer, "_type_via_sendinput", return_value=True) as mock:
@@ -65,51 +109,176 @@ class TestTextTyperTypeText:
             typer.type_text("hello")
             mock.assert_called_once_with("hello")
 
+    @patch("mickey.typer.time.sleep")
+    def test_focus_delay_only_on_first_paste(self, mock_sleep):
+        typer = TextTyper(method=InputMethod.SENDINPUT)
+        with patch.object(typer, "_type_via_sendinput", return_value=True):
+            typer.type_text("hello")
+            typer.type_text("again")
+        mock_sleep.assert_called_once_with(0.05)
+
+    @patch("mickey.typer.time.sleep")
+    def test_reset_focus_restores_delay(self, mock_sleep):
+        typer = TextTyper(method=InputMethod.SENDINPUT)
+        with patch.object(typer, "_type_via_sendinput", return_value=True):
+            typer.type_text("hello")
+            typer.reset_focus()
+            typer.type_text("again")
+        assert mock_sleep.call_count == 2
+
 
 class TestSendInputTyping:
     @patch("mickey.typer.time.sleep")
     def test_type_via_sendinput_returns_true(self, mock_sleep):
         typer = TextTyper(method=InputMethod.SENDINPUT)
-        with patch("ctypes.windll.user32.SendInput", return_value=2):
+        with patch("mickey.typer._SendInput", return_value=2):
             result = typer._type_via_sendinput("Hi")
         assert result is True
 
     @patch("mickey.typer.time.sleep")
     def test_type_via_sendinput_calls_send_input(self, mock_sleep):
         typer = TextTyper(method=InputMethod.SENDINPUT)
-        with patch("ctypes.windll.user32.SendInput") as mock_send:
+        with patch("mickey.typer._SendInput") as mock_send:
             mock_send.return_value = 4
             typer._type_via_sendinput("Hi")
         mock_send.assert_called_once()
         assert mock_send.call_args[0][0] == 4
 
     @patch("mickey.typer.time.sleep")
-    def test_type_via_sendinput_chunks_long_text(self, mock_sleep):
+    def test_type_via_sendinput_sends_long_text_in_one_call(self, mock_sleep):
         typer = TextTyper(method=InputMethod.SENDINPUT, typing_delay=0)
-        with patch("ctypes.windll.user32.SendInput") as mock_send:
-            mock_send.return_value = 40
+        with patch("mickey.typer._SendInput") as mock_send:
+            mock_send.return_value = 100
+            typer._type_via_sendinput("A" * 50)
+        mock_send.assert_called_once()
+        assert mock_send.call_args[0][0] == 100
+
+    @patch("mickey.typer.time.sleep")
+    def test_type_via_sendinput_chunks_long_text(self, mock_sleep):
+        typer = TextTyper(method=InputMethod.SENDINPUT, typing_delay=0, chunked=True)
+        with patch("mickey.typer._SendInput") as mock_send:
+            mock_send.return_value = 128
             typer._type_via_sendinput("A" * 50)
-        assert mock_send.call_count == 3
+            assert mock_send.call_count == 1
+            typer._type_via_sendinput("A" * 150)
+        assert mock_send.call_count == 4
 
     @patch("mickey.typer.time.sleep")
     def test_type_via_sendinput_sleeps_between_chunks(self, mock_sleep):
-        typer = TextTyper(method=InputMethod.SENDINPUT, typing_delay=0.01)
-        with patch("ctypes.windll.user32.SendInput") as mock_send:
-            mock_send.return_value = 40
-            typer._type_via_sendinput("A" * 30)
+        typer = TextTyper(method=InputMethod.SENDINPUT, typing_delay=0.01, chunked=True)
+        with patch("mickey.typer._SendInput") as mock_send:
+            mock_send.return_value = 128
+            typer._type_via_sendinput("A" * 100)
         sleep_calls = [c[0][0] for c in mock_sleep.call_args_list]
-        assert 0.05 in sleep_calls
         assert 0.01 in sleep_calls
 
+    @patch("mickey.typer.time.sleep")
+    def test_type_via_sendinput_chunks_reuse_input_buffer(self, mock_sleep):
+        typer = TextTyper(method=InputMethod.SENDINPUT, typing_delay=0, chunked=True)
+        with patch("mickey.typer._SendInput") as mock_send:
+            typer._type_via_sendinput("a" * 64 + "b" * 5)
+        first, second = (c[0][1] for c in mock_send.call_args_list)
+        assert ctypes.addressof(first) == ctypes.addressof(typer._input_buf)
+        assert ctypes.addressof(second) == ctypes.addressof(typer._input_buf)
+        assert [inp._input.ki.wScan for inp in second] == [ord("b")] * 10
+
+    @patch("mickey.typer.time.sleep")
+    def test_type_via_sendinput_grows_input_buffer(self, mock_sleep):
+        typer = TextTyper(method=InputMethod.SENDINPUT)
+        with patch("mickey.typer._SendInput") as mock_send:
+            typer._type_via_sendinput("A" * 100)
+            grown = typer._input_buf
+            typer._type_via_sendinput("B" * 100)
+        assert typer._input_buf is grown
+        inputs = mock_send.call_args[0][1]
+        assert ctypes.addressof(inputs) == ctypes.addressof(grown)
+        assert len(inputs) == 200
+
+    @patch("mickey.typer.time.sleep")
+    def test_type_via_sendinput_chunks_keep_surrogate_pairs(self, mock_sleep):
+        typer = TextTyper(method=InputMethod.SENDINPUT, typing_delay=0, chunked=True)
+        with patch("mickey.typer._SendInput") as mock_send:
+            typer._type_via_sendinput("a" * 63 + "\U0001f600")
+        assert [c[0][0] for c in mock_send.call_args_list] == [126, 4]
+        scans = [inp._input.ki.wScan for inp in mock_send.call_args[0][1]]
+        assert scans == [0xD83D, 0xD83D, 0xDE00, 0xDE00]
+
+    @patch("mickey.typer.time.sleep")
+    def test_adaptive_delay_skips_sleep_after_full_accept(self, mock_sleep):
+        typer = TextTyper(
+            method=InputMethod.SENDINPUT,
+            typing_delay=0.01,
+            chunked=True,
+            adaptive_delay=True,
+        )
+        with patch("mickey.typer._SendInput", side_effect=lambda n, *_: n):
+            typer._type_via_sendinput("A" * 150)
+        mock_sleep.assert_not_called()
+
+    @patch("mickey.typer.time.sleep")
+    def test_adaptive_delay_sleeps_after_partial_accept(self, mock_sleep):
+        typer = TextTyper(
+            method=InputMethod.SENDINPUT,
+            typing_delay=0.01,
+            chunked=True,
+            adaptive_delay=True,
+        )
+        with patch("mickey.typer._SendInput", side_effect=[128, 50, 44]):
+            typer._type_via_sendinput("A" * 150)
+        assert [c[0][0] for c in mock_sleep.call_args_list] == [0.01]
+
     @patch("mickey.typer.time.sleep")
     def test_type_via_sendinput_handles_emoji(self, mock_sleep):
         typer = TextTyper(method=InputMethod.SENDINPUT)
-        with patch("ctypes.windll.user32.SendInput") as mock_send:
+        with patch("mickey.typer._SendInput") as mock_send:
             mock_send.return_value = 4
             result = typer._type_via_sendinput("\U0001f600")
         assert result is True
         assert mock_send.call_args[0][0] == 4
 
+    @patch("mickey.typer.time.sleep")
+    def test_type_via_sendinput_ascii_scan_codes(self, mock_sleep):
+        typer = TextTyper(method=InputMethod.SENDINPUT)
+        with patch("mickey.typer._SendInput") as mock_send:
+            typer._type_via_sendinput("Hi")
+        inputs = mock_send.call_args[0][1]
+        assert [inp._input.ki.wScan for inp in inputs] == [72, 72, 105, 105]
+        assert [inp._input.ki.dwFlags for inp in inputs] == [4, 6, 4, 6]
+
+    @patch("mickey.typer.time.sleep")
+    def test_type_via_sendinput_emoji_surrogate_pair(self, mock_sleep):
+        typer = TextTyper(method=InputMethod.SENDINPUT)
+        with patch("mickey.typer._SendInput") as mock_send:
+            typer._type_via_sendinput("\U0001f600")
+        inputs = mock_send.call_args[0][1]
+        scans = [inp._input.ki.wScan for inp in inputs]
+        assert scans == [0xD83D, 0xD83D, 0xDE00, 0xDE00]
+
+    def test_send_input_resolved_once_with_signature(self):
+        from ctypes import wintypes
+
+        from mickey import typer as typer_module
+
+        resolve = typer_module._resolve_send_input
+        resolve.cache_clear()
+        try:
+            with patch("mickey.typer.ctypes.WinDLL", create=True) as mock_dll:
+                send_input = resolve()
+                assert resolve() is send_input
+        finally:
+            resolve.cache_clear()
+        mock_dll.assert_called_once_with("user32", use_last_error=True)
+        assert send_input is mock_dll.return_value.SendInput
+        assert send_input.argtypes == [
+            wintypes.UINT,
+            ctypes.POINTER(typer_module.INPUT),
+            ctypes.c_int,
+        ]
+        assert send_input.restype is wintypes.UINT
+
+    def test_event_pair_is_cached(self):
+        assert _event_pair(ord("a")) is _event_pair(ord("a"))
+
 
 class TestKeystrokeTyping:
     @patch("mickey.typer.time.sleep")
@@ -0,0 +1,49 @@
+"""Tests for mickey.worker module."""
+
+import threading
+
+import pytest
+
+from mickey.worker import SerialWorker
+
+
+class TestSerialWorker:
+    def test_runs_jobs_in_order_on_daemon_thread(self):
+        worker = SerialWorker("test-worker")
+        seen = []
+        worker.submit(lambda: seen.append(threading.current_thread()))
+        future = worker.submit(lambda: 42)
+        assert future.result(timeout=1) == 42
+        assert seen[0].daemon
+        assert seen[0].name == "test-worker"
+        worker.shutdown()
+
+    def test_exception_is_stored_on_future(self):
+        worker = SerialWorker("test-worker")
+        future = worker.submit(lambda: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            future.result(timeout=1)
+        worker.shutdown()
+
+    def test_shutdown_cancels_pending_jobs(self):
+        worker = SerialWorker("test-worker")
+        started = threading.Event()
+        release = threading.Event()
+
+        def job():
+            started.set()
+            return release.wait(1)
+
+        running = worker.submit(job)
+        assert started.wait(1)
+        pending = worker.submit(lambda: None)
+        worker.shutdown(cancel_futures=True)
+        assert pending.cancelled()
+        release.set()
+        assert running.result(timeout=1) is True
+
+    def test_submit_after_shutdown_raises(self):
+        worker = SerialWorker("test-worker")
+        worker.shutdown()
+        with pytest.raises(RuntimeError):
+            worker.submit(lambda: None)